@@ -42,6 +42,7 @@ class Settings:
     ASR_MODELS_CONFIG: str = BASE_DIR / "app/services/asr/models.json"
     ASR_MODEL_MODE: str = "all"  # all / offline / realtime, 子服务也读这个 env
     ASR_ENABLE_REALTIME_PUNC: bool = False  # 转发给 funasr 子服务的实时 PUNC 开关
+    ASR_REALTIME_MIN_CHUNK_MS: int = 240  # 流式 ASR 攒够多少 ms 才送一次模型: 240 / 600
     AUTO_LOAD_CUSTOM_ASR_MODELS: str = ""  # 网关启动时预热的额外模型 id, 逗号分隔
 
     # 流式 ASR 远场过滤(网关侧句子状态机用,与子服务无关)
@@ -126,6 +127,9 @@ class Settings:
         self.ASR_ENABLE_REALTIME_PUNC = (
             os.getenv("ASR_ENABLE_REALTIME_PUNC", "false").lower() == "true"
         )
+        self.ASR_REALTIME_MIN_CHUNK_MS = int(
+            os.getenv("ASR_REALTIME_MIN_CHUNK_MS", str(self.ASR_REALTIME_MIN_CHUNK_MS))
+        )
         self.AUTO_LOAD_CUSTOM_ASR_MODELS = os.getenv(
             "AUTO_LOAD_CUSTOM_ASR_MODELS", self.AUTO_LOAD_CUSTOM_ASR_MODELS
         )
@@ -4,7 +4,11 @@
 把同步阻塞调用(主要是 HTTP 客户端 / 同步 WS session)派发到线程池,
 避免阻塞 FastAPI 的事件循环。
 
-线程数由 INFERENCE_THREAD_POOL_SIZE 控制, 默认 max(4, CPU 核数)。
+线程数由 INFERENCE_THREAD_POOL_SIZE 控制, 默认 max(32, CPU 核数 * 8)。
+
+实时 ASR 的逐 chunk 调用走独立线程池(run_sync_realtime, 大小由
+REALTIME_THREAD_POOL_SIZE 控制, 默认同 INFERENCE_THREAD_POOL_SIZE), 不与
+文件识别 / TTS / 音频转码等长耗时调用共用线程, 避免后者占满线程池时实时会话排队。
 """
 
 import os
@@ -26,7 +30,11 @@ T = TypeVar("T")
 _DEFAULT_WORKERS = max(32, (os.cpu_count() or 4) * 8)
 _MAX_WORKERS = int(os.getenv("INFERENCE_THREAD_POOL_SIZE", str(_DEFAULT_WORKERS)))
 
+# 未单独设置时与网关线程池同大小
+_REALTIME_WORKERS = int(os.getenv("REALTIME_THREAD_POOL_SIZE", str(_MAX_WORKERS)))
+
 _executor: ThreadPoolExecutor = None
+_realtime_executor: ThreadPoolExecutor = None
 
 
 def get_executor() -> ThreadPoolExecutor:
@@ -41,13 +49,29 @@ def get_executor() -> ThreadPoolExecutor:
     return _executor
 
 
+def get_realtime_executor() -> ThreadPoolExecutor:
+    """获取实时 ASR 专用线程池执行器（懒加载）"""
+    global _realtime_executor
+    if _realtime_executor is None:
+        _realtime_executor = ThreadPoolExecutor(
+            max_workers=_REALTIME_WORKERS,
+            thread_name_prefix="realtime_worker"
+        )
+        logger.info(f"实时识别线程池已创建，最大工作线程数: {_REALTIME_WORKERS}")
+    return _realtime_executor
+
+
 def shutdown_executor():
     """关闭线程池执行器"""
-    global _executor
+    global _executor, _realtime_executor
     if _executor is not None:
         _executor.shutdown(wait=True)
         _executor = None
         logger.info("推理线程池已关闭")
+    if _realtime_executor is not None:
+        _realtime_executor.shutdown(wait=True)
+        _realtime_executor = None
+        logger.info("实时识别线程池已关闭")
 
 
 async def run_sync(func: Callable[..., T], *args, **kwargs) -> T:
@@ -65,8 +89,18 @@ async def run_sync(func: Callable[..., T], *args, **kwargs) -> T:
     Example:
         result = await run_sync(model.generate, input=audio_array, cache=cache)
     """
+    return await _run_in_executor(get_executor(), func, args, kwargs)
+
+
+async def run_sync_realtime(func: Callable[..., T], *args, **kwargs) -> T:
+    """与 run_sync 相同, 但派发到实时 ASR 专用线程池"""
+    return await _run_in_executor(get_realtime_executor(), func, args, kwargs)
+
+
+async def _run_in_executor(
+    executor: ThreadPoolExecutor, func: Callable[..., T], args: tuple, kwargs: dict
+) -> T:
     loop = asyncio.get_running_loop()
-    executor = get_executor()
 
     # 使用 partial 绑定参数
     if kwargs:
@@ -5,7 +5,15 @@ WebSocket ASR 数据模型 - 阿里云协议
 
 from typing import Optional, Dict, Any, Union, List
 from pydantic import BaseModel, Field, field_validator
-import uuid
+import itertools
+import secrets
+
+
+# message_id = 进程级随机前缀 + 单调计数器。每个连接每秒会发出大量消息,
+# 逐条 uuid4 (os.urandom + 格式化) 不划算; 前缀区分进程/worker,
+# 计数器保证进程内唯一 (itertools.count 的 next() 在 GIL 下是原子的)。
+_MESSAGE_ID_PREFIX = secrets.token_hex(8)
+_message_id_counter = itertools.count()
 
 
 class AliyunASRWSHeader(BaseModel):
@@ -22,8 +30,8 @@ class AliyunASRWSHeader(BaseModel):
 
     @staticmethod
     def generate_message_id() -> str:
-        """生成32位消息ID"""
-        return str(uuid.uuid4()).replace("-", "")[:32]
+        """生成32位消息ID (16位随机前缀 + 16位十六进制计数)"""
+        return f"{_MESSAGE_ID_PREFIX}{next(_message_id_counter):016x}"
 
 
 class AliyunStartTranscriptionPayload(BaseModel):
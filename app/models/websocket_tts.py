@@ -5,10 +5,17 @@ WebSocket TTS 流式语音合成相关数据模型 - 阿里云协议
 
 from typing import Optional, Dict, Any, Union, List
 from pydantic import BaseModel, Field, field_validator
-import uuid
+import itertools
+import secrets
 from .common import SampleRate
 
 
+# message_id = 进程级随机前缀 + 单调计数器, 与 websocket_asr 相同:
+# 流式合成每个音频帧前后都有消息, 逐条 uuid4 不划算, 协议只要求唯一。
+_MESSAGE_ID_PREFIX = secrets.token_hex(8)
+_message_id_counter = itertools.count()
+
+
 class AliyunWSHeader(BaseModel):
     """阿里云WebSocket消息头部"""
 
@@ -23,8 +30,8 @@ class AliyunWSHeader(BaseModel):
 
     @staticmethod
     def generate_message_id() -> str:
-        """生成32位消息ID"""
-        return str(uuid.uuid4()).replace("-", "")[:32]
+        """生成32位消息ID (16位随机前缀 + 16位十六进制计数)"""
+        return f"{_MESSAGE_ID_PREFIX}{next(_message_id_counter):016x}"
 
 
 class AliyunStartSynthesisPayload(BaseModel):
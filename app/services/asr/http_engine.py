@@ -27,6 +27,7 @@ import numpy as np
 
 from ...core.config import settings
 from ...core.exceptions import DefaultServerErrorException
+from ...utils.audio_kernels import float32_to_pcm16
 from .engine import BaseASREngine, RealTimeASREngine
 
 logger = logging.getLogger(__name__)
@@ -75,6 +76,24 @@ def get_async_httpx_client() -> httpx.AsyncClient:
     return _httpx_async_client
 
 
+# ---------------------------------------------------------------------------
+# 线程局部 int16 草稿缓冲 — send_chunk 在 run_sync 工作线程里执行,
+# 每个线程复用自己的一块缓冲做 float32 → PCM16 量化, 避免每个 chunk 分配临时数组
+# ---------------------------------------------------------------------------
+
+_scratch_tls = threading.local()
+_SCRATCH_MIN_SAMPLES = 32000  # 2s @ 16kHz, 覆盖常见 chunk 大小
+
+
+def _scratch_int16(n: int) -> np.ndarray:
+    """返回当前线程长度为 n 的 int16 缓冲视图(内容未初始化)"""
+    buf = getattr(_scratch_tls, "pcm16", None)
+    if buf is None or buf.size < n:
+        buf = np.empty(max(n, _SCRATCH_MIN_SAMPLES), dtype=np.int16)
+        _scratch_tls.pcm16 = buf
+    return buf[:n]
+
+
 class _HttpReplicaPool:
     """简易副本池: 最少连接 + 健康过滤(被动: 失败一次即记一次,后续依赖 manager 的健康检查升级)"""
 
@@ -138,7 +157,10 @@ class _RealtimeASRSession:
             sep = "&" if "?" in full_url else "?"
             full_url = f"{full_url}{sep}token={internal_token}"
 
-        self._ws = ws_connect(full_url, open_timeout=timeout, close_timeout=5.0)
+        # 上行是 PCM16 音频, 几乎不可压缩; 不协商 permessage-deflate, 省两端 CPU
+        self._ws = ws_connect(
+            full_url, open_timeout=timeout, close_timeout=5.0, compression=None
+        )
         self._lock = threading.Lock()
         self._closed = False
         self._timeout = timeout
@@ -165,10 +187,11 @@ class _RealtimeASRSession:
             if self._closed:
                 return {"text": "", "text_punc": "", "is_silence": True}
 
-            pcm_int16 = (
-                np.asarray(audio_array_float32, dtype=np.float32) * 32768.0
-            ).astype(np.int16)
-            self._ws.send(pcm_int16.tobytes())
+            audio = np.ascontiguousarray(audio_array_float32, dtype=np.float32).ravel()
+            pcm_int16 = _scratch_int16(audio.size)
+            float32_to_pcm16(audio, pcm_int16)
+            # send 返回前已完成分帧拷贝, 线程局部缓冲可直接以 memoryview 发送
+            self._ws.send(memoryview(pcm_int16).cast("B"))
 
             # 读直到收到 partial 或 error
             # 每个 recv 都带超时, 上游子服务卡死时不会让网关线程永久阻塞
@@ -327,7 +350,10 @@ class _HttpRealtimeModel:
             "decoder_lookback": kwargs.get("decoder_chunk_look_back", 1),
             "sample_rate": int(kwargs.get("sample_rate", 16000)),
             "format": kwargs.get("format", "pcm"),
-            "enable_realtime_punc": settings.ASR_ENABLE_REALTIME_PUNC,
+            # 网关可按连接参数关闭(如客户端不要中间结果), 缺省沿用全局配置
+            "enable_realtime_punc": kwargs.get(
+                "enable_realtime_punc", settings.ASR_ENABLE_REALTIME_PUNC
+            ),
         }
 
         session = cache.get(self._SESSION_KEY)
@@ -537,7 +537,8 @@ class CosyVoiceHttpEngine:
 
         ws = None
         try:
-            ws = await connect(ws_url, open_timeout=self._timeout)
+            # 内部流是 float32 PCM, 几乎不可压缩; 不协商 permessage-deflate, 省两端 CPU
+            ws = await connect(ws_url, open_timeout=self._timeout, compression=None)
             await ws.send(
                 json.dumps(
                     {
@@ -545,7 +546,8 @@ class CosyVoiceHttpEngine:
                         "voice": voice,
                         "speed": speed,
                         "prompt": prompt,
-                    }
+                    },
+                    ensure_ascii=False,
                 )
             )
             # 第 1 帧 JSON: started + sample_rate
@@ -334,7 +334,8 @@ class Qwen3TTSHttpEngine:
 
         ws = None
         try:
-            ws = await connect(ws_url, open_timeout=self._timeout)
+            # 内部流是 float32 PCM, 几乎不可压缩; 不协商 permessage-deflate, 省两端 CPU
+            ws = await connect(ws_url, open_timeout=self._timeout, compression=None)
             await ws.send(
                 json.dumps(
                     {
@@ -28,9 +28,10 @@ WebSocket ASR 服务 - 阿里云实时语音识别协议实现
 3. 双轨处理：同时维护带标点版本（展示用）和无标点版本（最终标点恢复用）
 """
 
-import json
+import asyncio
 import logging
 import numpy as np
+import orjson
 import soundfile as sf
 import io
 from typing import Optional, Dict
@@ -39,10 +40,13 @@ from enum import IntEnum
 from fastapi import WebSocketDisconnect
 
 from ..core.config import settings
-from ..core.executor import run_sync
+from ..core.executor import run_sync_realtime
 from ..core.security import validate_token_websocket
 from ..utils.text_processing import apply_itn_to_text
 from ..utils.audio_filter import is_nearfield_voice
+from ..utils.audio_kernels import abs_max_until, pcm16_to_float32
+from .asr.http_engine import FunASRHttpEngine, Qwen3AsrVllmHttpEngine
+from .ws_sender import QueuedSender
 from ..models.websocket_asr import (
     AliyunASRWSHeader,
     AliyunASRNamespace,
@@ -51,6 +55,136 @@ from ..models.websocket_asr import (
 )
 logger = logging.getLogger(__name__)
 
+# 句末 flush (is_final) 时的占位输入
+_EMPTY_AUDIO = np.zeros(0, dtype=np.float32)
+
+# 静音帧判定: max|x| < _SILENCE_THRESHOLD * 2
+_SILENCE_THRESHOLD = 0.001
+
+# chunk_stride(4-10) → FunASR chunk_size 参数, 预先建好避免每个 chunk 新建列表(只读)
+_CHUNK_SIZE_BY_STRIDE = {stride: [0, stride, 5] for stride in range(4, 11)}
+
+# 句末标点(str.endswith 接受元组, 一次调用比较全部后缀)
+_SENTENCE_ENDINGS = ("。", "！", "？", ".", "!", "?", "…")
+
+# 后台收包队列上限(消息数): 推理期间继续收包, 积压过多时再对客户端反压
+_INBOX_MAXSIZE = 256
+
+
+
+# 成功响应 header 中除 message_id / task_id / name 外的固定字段
+_SUCCESS_STATUS_MESSAGE = "GATEWAY|SUCCESS|Success."
+
+# TranscriptionCompleted header 的固定尾部(已序列化, 含 header 的右括号)
+_COMPLETED_HEADER_TAIL = orjson.dumps(
+    {
+        "namespace": AliyunASRNamespace.SPEECH_TRANSCRIBER,
+        "name": AliyunASRMessageName.TRANSCRIPTION_COMPLETED,
+        "status": AliyunASRStatus.SUCCESS,
+        "status_message": _SUCCESS_STATUS_MESSAGE,
+    }
+).decode()[1:]
+
+# TaskFailed header 的固定开头(已序列化, 不含两侧括号)
+_TASK_FAILED_HEADER_HEAD = orjson.dumps(
+    {
+        "namespace": AliyunASRNamespace.SPEECH_TRANSCRIBER,
+        "name": AliyunASRMessageName.TASK_FAILED,
+        "status": AliyunASRStatus.TASK_FAILED,
+    }
+).decode()[1:-1]
+
+
+def _success_header(task_id: str, name: str) -> dict:
+    """构建成功响应的 header
+
+    固定字段取模块常量, 只填 message_id / task_id / name; 直接用 dict 字面量,
+    比基于模板 dict 做 {**base, ...} 展开少一次拷贝。
+    """
+    return {
+        "message_id": AliyunASRWSHeader.generate_message_id(),
+        "task_id": task_id,
+        "namespace": AliyunASRNamespace.SPEECH_TRANSCRIBER,
+        "name": name,
+        "status": AliyunASRStatus.SUCCESS,
+        "status_message": _SUCCESS_STATUS_MESSAGE,
+    }
+
+
+def _pcm16_to_float32(audio_bytes: bytes, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """PCM16 字节 → float32 [-1, 1]
+
+    np.frombuffer 只建 int16 只读视图(零拷贝), 再由 Numba 内核单遍缩放后
+    直接写进 float32 输出, 不再产生 astype + 除法两个中间数组。
+    传入 out 时写进调用方的缓冲区(长度需 >= 采样数), 返回其前 n 个元素的视图。
+    """
+    pcm = np.frombuffer(audio_bytes, dtype=np.int16)
+    if out is None:
+        out = np.empty(pcm.size, dtype=np.float32)
+    else:
+        out = out[: pcm.size]
+    pcm16_to_float32(pcm, out)
+    return out
+
+
+class _AudioRingBuffer:
+    """连接级预分配 float32 音频缓冲区
+
+    写入直接落在预分配数组尾部(PCM 直接解码进去), 取 chunk 返回连续视图;
+    尾部空间不够时把未消费的残留(不足一个 chunk)搬回开头, 仍不够才扩容。
+    pop 返回的视图在下一次写入前有效。
+    """
+
+    def __init__(self, capacity: int):
+        self._buf = np.empty(capacity, dtype=np.float32)
+        self._head = 0
+        self._tail = 0
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    def _reserve(self, n: int) -> np.ndarray:
+        if self._tail + n > self._buf.size:
+            size = self._tail - self._head
+            if size + n > self._buf.size:
+                buf = np.empty(max(self._buf.size * 2, size + n), dtype=np.float32)
+                buf[:size] = self._buf[self._head : self._tail]
+                self._buf = buf
+            else:
+                self._buf[:size] = self._buf[self._head : self._tail]
+            self._head, self._tail = 0, size
+        return self._buf[self._tail : self._tail + n]
+
+    def extend(self, samples: np.ndarray) -> int:
+        n = samples.size
+        self._reserve(n)[:] = samples
+        self._tail += n
+        return n
+
+    def extend_pcm16(self, audio_bytes: bytes) -> int:
+        n = len(audio_bytes) // 2
+        _pcm16_to_float32(audio_bytes, out=self._reserve(n))
+        self._tail += n
+        return n
+
+    def extend_soundfile(self, sound_file: sf.SoundFile, max_frames: int) -> int:
+        """单声道音频直接由 soundfile 解码进缓冲区, 不经中间数组
+
+        流式 WAV 头里的长度可能是占位值, 预留空间按调用方给的上限截断,
+        以实际读出的帧数为准。
+        """
+        n = min(sound_file.frames, max_frames)
+        n = sound_file.read(out=self._reserve(n)).shape[0]
+        self._tail += n
+        return n
+
+    def pop(self, n: int) -> np.ndarray:
+        chunk = self._buf[self._head : self._head + n]
+        self._head += n
+        if self._head == self._tail:
+            self._head = self._tail = 0
+        return chunk
+
 
 class ConnectionState(IntEnum):
     """连接状态"""
@@ -60,6 +194,12 @@ class ConnectionState(IntEnum):
     COMPLETED = 3
 
 
+# 热路径上的状态比较用纯 int, 绕开 IntEnum.__eq__ 的额外开销
+_ST_READY = int(ConnectionState.READY)
+_ST_STARTED = int(ConnectionState.STARTED)
+_ST_COMPLETED = int(ConnectionState.COMPLETED)
+
+
 class AliyunWebSocketASRService:
     """阿里云WebSocket实时ASR服务"""
 
@@ -100,7 +240,7 @@ class AliyunWebSocketASRService:
 
     async def _process_websocket_connection(self, websocket, task_id: str):
         """处理WebSocket连接"""
-        state = ConnectionState.READY
+        state = _ST_READY
         session_id = f"session_{task_id}"
         transcription_params = None
         audio_cache = {}
@@ -109,12 +249,35 @@ class AliyunWebSocketASRService:
         audio_time = 0
         sentence_active = False
         sentence_start_time = 0
-        last_sentence_text = ""
-        sentence_texts = []
+        last_result_text = ""  # 上一次的识别文本, 相同结果去重
+        sentence_text_acc = ""  # 当前句累计文本, 供中间结果直接发送
         sentence_texts_raw = []
         empty_result_count = 0
-        audio_buffer = np.array([], dtype=np.float32)  # 音频缓冲区，用于累积到完整chunk
-        _is_qwen3 = None  # 懒初始化，首次使用时判断引擎类型
+        _is_qwen3 = False  # StartTranscription 时按引擎类型确定
+
+        # 小帧在 audio_buffer 里合并, 攒够最小标准 chunk 才调一次模型。
+        # 标准chunk大小（对应不同的chunk_stride）:
+        # 3840 samples = 240ms @ 16kHz (chunk_stride=4, 低延迟)
+        # 9600 samples = 600ms @ 16kHz (chunk_stride=10, 高准确率, 调用次数约为 240ms 的 2/5)
+        # ASR_REALTIME_MIN_CHUNK_MS 过滤掉小于该时长的档位
+        min_chunk_samples = settings.ASR_REALTIME_MIN_CHUNK_MS * 16
+        # 按从大到小排好, 每包只需顺序比较
+        chunk_sizes_desc = tuple(
+            size for size in (9600, 3840) if size >= min_chunk_samples
+        ) or (9600,)
+        max_chunk_size = chunk_sizes_desc[0]
+        min_chunk_size = chunk_sizes_desc[-1]
+        # 音频缓冲区(预分配环形, 用于累积到完整chunk)
+        audio_buffer = _AudioRingBuffer(max_chunk_size * 4)
+
+        # 收包与处理解耦: 后台任务持续读 WebSocket, 推理进行中也不停止收包
+        inbox: asyncio.Queue = asyncio.Queue(maxsize=_INBOX_MAXSIZE)
+        reader_task = None
+        # 所有下行消息经发送队列由后台 writer 写出; 始终用文本帧(send_text):
+        # 阿里云协议客户端(含 SDK 与测试页 JSON.parse)按文本帧解析
+        sender = QueuedSender(websocket)
+        # 合并排队音频包时取出的非音频消息, 下一轮优先处理
+        pending_message = None
 
         logger.info(f"[{task_id}] WebSocket ASR连接开始")
 
@@ -123,125 +286,202 @@ class AliyunWebSocketASRService:
                 x_nls_token = websocket.headers.get("X-NLS-Token")
                 if settings.APPTOKEN and not x_nls_token:
                     await self._send_task_failed(
-                        websocket, task_id, "X-NLS-Token not found in ws header"
+                        sender, task_id, "X-NLS-Token not found in ws header"
                     )
                     return
 
                 if x_nls_token:
                     result, message = validate_token_websocket(x_nls_token, task_id)
                     if not result:
-                        await self._send_task_failed(websocket, task_id, message)
+                        await self._send_task_failed(sender, task_id, message)
                         return
 
+            reader_task = asyncio.create_task(self._receive_messages(websocket, inbox))
+
             while True:
-                message = await websocket.receive()
+                if pending_message is not None:
+                    message, pending_message = pending_message, None
+                else:
+                    message = await inbox.get()
+                if isinstance(message, BaseException):
+                    raise message
 
                 if "text" in message:
                     try:
-                        data = json.loads(message["text"])
-                        logger.debug(
-                            f"[{task_id}] 收到消息: {data.get('header', {}).get('name', '')}"
-                        )
+                        data = orjson.loads(message["text"])
 
                         header = data.get("header", {})
                         message_name = header.get("name", "")
                         message_task_id = header.get("task_id", "")
                         namespace = header.get("namespace", "")
+                        logger.debug("[%s] 收到消息: %s", task_id, message_name)
 
                         if namespace != AliyunASRNamespace.SPEECH_TRANSCRIBER:
                             await self._send_task_failed(
-                                websocket, task_id, "Invalid namespace"
+                                sender, task_id, "Invalid namespace"
                             )
                             continue
 
                         if message_name == AliyunASRMessageName.START_TRANSCRIPTION:
-                            if state == ConnectionState.READY:
+                            if state == _ST_READY:
                                 transcription_params = self._parse_start_transcription(
                                     data, task_id
                                 )
                                 if transcription_params:
                                     task_id = message_task_id or task_id
 
+                                    # 连接级参数只在这里解析一次, 音频热路径只读局部变量
+                                    audio_format = transcription_params.get("format", "pcm")
+                                    sample_rate = transcription_params["sample_rate"]
+                                    punctuation_enabled = transcription_params.get(
+                                        "enable_punctuation_prediction", True
+                                    )
+                                    itn_enabled = transcription_params.get(
+                                        "enable_inverse_text_normalization", True
+                                    )
+                                    intermediate_enabled = transcription_params.get(
+                                        "enable_intermediate_result", True
+                                    )
+                                    max_empty_count = max(
+                                        3,
+                                        (
+                                            transcription_params.get(
+                                                "max_sentence_silence", 800
+                                            )
+                                            * 2
+                                        )
+                                        // 600,
+                                    )
+                                    # 每种标准 chunk 的时长只取决于采样率, 连接内查表即可
+                                    chunk_ms_by_size = {
+                                        size: int(size / sample_rate * 1000)
+                                        for size in chunk_sizes_desc
+                                    }
+
                                     # HTTP 客户端引擎在每次调用内部用副本池调度,
                                     # 网关层这里只持引擎引用即可,无需 session 级绑定。
-                                    self._ensure_asr_engine()
+                                    # 引擎类型整个连接不变, 在此判断一次
+                                    _is_qwen3 = isinstance(
+                                        self._ensure_asr_engine(), Qwen3AsrVllmHttpEngine
+                                    )
 
                                     await self._send_transcription_started(
-                                        websocket, task_id, session_id
+                                        sender, task_id, session_id
                                     )
-                                    state = ConnectionState.STARTED
+                                    state = _ST_STARTED
+
                                     sentence_index = 0
                                     audio_time = 0
                                     sentence_active = False
                                     sentence_start_time = 0
-                                    last_sentence_text = ""
-                                    sentence_texts = []
+                                    last_result_text = ""
+                                    sentence_text_acc = ""
                                     sentence_texts_raw = []
                                     empty_result_count = 0
                                 else:
                                     await self._send_task_failed(
-                                        websocket,
+                                        sender,
                                         task_id,
                                         "Invalid StartTranscription parameters",
                                     )
                             else:
                                 await self._send_task_failed(
-                                    websocket, task_id, "Connection already started"
+                                    sender, task_id, "Connection already started"
                                 )
 
                         elif message_name == AliyunASRMessageName.STOP_TRANSCRIPTION:
-                            if state == ConnectionState.STARTED:
+                            if state == _ST_STARTED:
                                 if message_task_id != task_id:
                                     await self._send_task_failed(
-                                        websocket, task_id, "Task ID not match"
+                                        sender, task_id, "Task ID not match"
                                     )
                                     continue
 
+                                # 缓冲区里不足一个标准 chunk 的尾音先按普通 chunk 送出, 再 flush 取回
+                                # 剩余文本(引擎的 is_final 只做 flush, 不带音频); 否则最后至多
+                                # ASR_REALTIME_MIN_CHUNK_MS 的语音会被丢弃
+                                tail_len = len(audio_buffer)
+                                if tail_len or (sentence_active and sentence_texts_raw):
+                                    tail_start_time = audio_time
+                                    final_steps = (
+                                        ((audio_buffer.pop(tail_len), False),) if tail_len else ()
+                                    ) + ((_EMPTY_AUDIO, True),)
+                                    for tail_audio, tail_is_final in final_steps:
+                                        (
+                                            _,
+                                            tail_text_raw,
+                                            _,
+                                            _,
+                                            audio_time,
+                                        ) = await self._process_audio_chunk(
+                                            tail_audio,
+                                            audio_cache,
+                                            punc_cache,
+                                            transcription_params,
+                                            audio_time,
+                                            task_id,
+                                            is_final=tail_is_final,
+                                        )
+                                        if not tail_text_raw:
+                                            continue
+                                        if _is_qwen3:
+                                            sentence_texts_raw = [tail_text_raw]
+                                        elif (
+                                            not sentence_texts_raw
+                                            or tail_text_raw != sentence_texts_raw[-1]
+                                        ):
+                                            sentence_texts_raw.append(tail_text_raw)
+                                    if sentence_texts_raw and not sentence_active:
+                                        sentence_active = True
+                                        sentence_start_time = tail_start_time
+                                        await self._send_sentence_begin(
+                                            sender,
+                                            task_id,
+                                            sentence_index + 1,
+                                            sentence_start_time,
+                                        )
+
                                 # 如果有未完成的句子，直接结束
                                 if sentence_active and sentence_texts_raw:
                                     sentence_index += 1
                                     full_sentence_text = "".join(sentence_texts_raw)
 
-                                    if transcription_params.get(
-                                        "enable_punctuation_prediction", True
-                                    ):
+                                    if punctuation_enabled:
                                         full_sentence_text = await self._apply_final_punctuation_to_sentence(
                                             full_sentence_text, task_id
                                         )
 
                                     await self._send_sentence_end(
-                                        websocket,
+                                        sender,
                                         task_id,
                                         sentence_index,
                                         audio_time,
                                         full_sentence_text,
                                         sentence_start_time,
-                                        enable_itn=transcription_params.get(
-                                            "enable_inverse_text_normalization", True
-                                        ),
+                                        enable_itn=itn_enabled,
                                     )
 
                                 await self._send_transcription_completed(
-                                    websocket, task_id
+                                    sender, task_id
                                 )
-                                state = ConnectionState.COMPLETED
+                                state = _ST_COMPLETED
                                 logger.info(f"[{task_id}] 识别完成")
                                 break
                             else:
                                 await self._send_task_failed(
-                                    websocket, task_id, "Connection not started"
+                                    sender, task_id, "Connection not started"
                                 )
                         else:
                             await self._send_task_failed(
-                                websocket,
+                                sender,
                                 task_id,
                                 f"Invalid message name: {message_name}",
                             )
 
-                    except json.JSONDecodeError as e:
+                    except orjson.JSONDecodeError as e:
                         logger.error(f"[{task_id}] JSON解析错误: {e}")
                         await self._send_task_failed(
-                            websocket, task_id, f"Message Not Json: {message}"
+                            sender, task_id, f"Message Not Json: {message}"
                         )
                     except WebSocketDisconnect:
                         # 客户端断开，向外层抛出
@@ -249,61 +489,80 @@ class AliyunWebSocketASRService:
                         raise
                     except Exception as e:
                         logger.error(f"[{task_id}] 处理消息异常: {e}")
-                        await self._send_task_failed(websocket, task_id, str(e))
+                        await self._send_task_failed(sender, task_id, str(e))
                         break
 
                 elif "bytes" in message:
-                    if state == ConnectionState.STARTED:
+                    if state == _ST_STARTED:
                         audio_bytes = message["bytes"]
 
                         if not transcription_params:
                             await self._send_task_failed(
-                                websocket, task_id, "StartTranscription not received"
+                                sender, task_id, "StartTranscription not received"
                             )
                             continue
 
                         try:
                             # 将接收到的音频添加到缓冲区
-                            audio_format = transcription_params.get("format", "pcm")
-                            sample_rate = transcription_params.get("sample_rate", 16000)
-                            incoming_audio = self._convert_audio_bytes_to_array(
-                                audio_bytes, audio_format, sample_rate, task_id
+                            incoming_samples = self._append_audio(
+                                audio_buffer, audio_bytes, audio_format, sample_rate, task_id
                             )
-                            audio_buffer = np.concatenate([audio_buffer, incoming_audio])
+                            # 推理期间排队的小包一次并入缓冲区, 合并为更少的模型调用;
+                            # 遇到非音频消息即停止, 留到下一轮按顺序处理
+                            while True:
+                                try:
+                                    queued = inbox.get_nowait()
+                                except asyncio.QueueEmpty:
+                                    break
+                                if (
+                                    isinstance(queued, BaseException)
+                                    or queued.get("bytes") is None
+                                ):
+                                    pending_message = queued
+                                    break
+                                incoming_samples += self._append_audio(
+                                    audio_buffer,
+                                    queued["bytes"],
+                                    audio_format,
+                                    sample_rate,
+                                    task_id,
+                                )
+                            audio_buffer_len = len(audio_buffer)
 
                             logger.debug(
-                                f"[{task_id}] 收到音频 {len(incoming_audio)} samples, "
-                                f"缓冲区共 {len(audio_buffer)} samples"
+                                "[%s] 收到音频 %d samples, 缓冲区共 %d samples",
+                                task_id,
+                                incoming_samples,
+                                audio_buffer_len,
                             )
 
-                            # 定义标准chunk大小（支持多种，对应不同的chunk_stride）
-                            # 3840 samples = 240ms @ 16kHz (chunk_stride=4, 低延迟)
-                            # 9600 samples = 600ms @ 16kHz (chunk_stride=10, 高准确率)
-                            standard_chunk_sizes = [3840, 9600]
-
                             # 根据当前缓冲区大小选择最合适的chunk_size
                             # 策略：选择能完整处理的最大chunk，减少缓冲区残留
                             selected_chunk_size = None
-                            for chunk_size in sorted(standard_chunk_sizes, reverse=True):
-                                if len(audio_buffer) >= chunk_size:
+                            for chunk_size in chunk_sizes_desc:
+                                if audio_buffer_len >= chunk_size:
                                     selected_chunk_size = chunk_size
                                     break
 
                             # 如果缓冲区不足最小chunk，跳过本次处理
                             if selected_chunk_size is None:
                                 logger.debug(
-                                    f"[{task_id}] 缓冲区不足，等待更多数据 "
-                                    f"(当前{len(audio_buffer)}, 需要至少{min(standard_chunk_sizes)})"
+                                    "[%s] 缓冲区不足，等待更多数据 (当前%d, 需要至少%d)",
+                                    task_id,
+                                    audio_buffer_len,
+                                    min_chunk_size,
                                 )
                                 continue
 
+                            chunk_duration_ms = chunk_ms_by_size[selected_chunk_size]
+
                             # 处理缓冲区中所有完整的chunk
-                            while len(audio_buffer) >= selected_chunk_size:
+                            while audio_buffer_len >= selected_chunk_size:
                                 chunk_start_time = audio_time
 
                                 # 提取标准大小的chunk
-                                audio_chunk = audio_buffer[:selected_chunk_size]
-                                audio_buffer = audio_buffer[selected_chunk_size:]
+                                audio_chunk = audio_buffer.pop(selected_chunk_size)
+                                audio_buffer_len -= selected_chunk_size
 
                                 # ========== 远场声音过滤 ==========
                                 # 动态阈值：句子活跃时降低阈值，避免句子中间音量波动导致丢帧
@@ -324,12 +583,13 @@ class AliyunWebSocketASRService:
                                     # 远场声音：跳过ASR，但如果当前有活跃句子，需要继续计数以触发句子结束
                                     if settings.ASR_NEARFIELD_FILTER_LOG_ENABLED:
                                         logger.debug(
-                                            f"[{task_id}] 远场声音已过滤 - "
-                                            f"RMS: {filter_metrics['rms_energy']:.6f} (阈值: {effective_rms_threshold:.6f})"
+                                            "[%s] 远场声音已过滤 - RMS: %.6f (阈值: %.6f)",
+                                            task_id,
+                                            filter_metrics["rms_energy"],
+                                            effective_rms_threshold,
                                         )
 
                                     # 更新音频时间
-                                    chunk_duration_ms = int(len(audio_chunk) / sample_rate * 1000)
                                     audio_time += chunk_duration_ms
 
                                     # 如果当前有活跃句子，将远场音频视为空结果进行计数
@@ -347,43 +607,31 @@ class AliyunWebSocketASRService:
                                     # 近场声音，正常送入ASR处理
                                     if settings.ASR_NEARFIELD_FILTER_LOG_ENABLED and filter_metrics.get('enabled', True):
                                         logger.debug(
-                                            f"[{task_id}] 近场声音检测通过 - "
-                                            f"RMS: {filter_metrics['rms_energy']:.6f} (阈值: {effective_rms_threshold:.6f})"
+                                            "[%s] 近场声音检测通过 - RMS: %.6f (阈值: %.6f)",
+                                            task_id,
+                                            filter_metrics["rms_energy"],
+                                            effective_rms_threshold,
                                         )
 
-                                    # 将float32数组转换为PCM bytes (int16)
-                                    audio_chunk_int16 = (audio_chunk * 32768.0).astype(np.int16)
-                                    audio_bytes_chunk = audio_chunk_int16.tobytes()
-
                                     (
                                         result_text,
                                         result_text_raw,
                                         is_sentence_end,
                                         is_silence_frame,
-                                        audio_cache,
                                         audio_time,
                                     ) = await self._process_audio_chunk(
-                                        audio_bytes_chunk,
+                                        audio_chunk,
                                         audio_cache,
                                         punc_cache,
                                         transcription_params,
                                         audio_time,
                                         task_id,
                                         is_final=False,
+                                        precomputed_rms=filter_metrics.get("rms_energy"),
+                                        chunk_duration_ms=chunk_duration_ms,
                                     )
                                 # ========== 远场过滤结束 ==========
 
-                                max_empty_count = max(
-                                    3,
-                                    (
-                                        transcription_params.get(
-                                            "max_sentence_silence", 800
-                                        )
-                                        * 2
-                                    )
-                                    // 600,
-                                )
-
                                 if not result_text:
                                     empty_result_count += 1
                                     if (
@@ -392,7 +640,7 @@ class AliyunWebSocketASRService:
                                     ):
                                         is_sentence_end = True
                                         logger.debug(
-                                            f"[{task_id}] 连续空结果，判断句子结束"
+                                            "[%s] 连续空结果，判断句子结束", task_id
                                         )
                                 else:
                                     empty_result_count = 0
@@ -404,34 +652,31 @@ class AliyunWebSocketASRService:
                                     and sentence_texts_raw
                                 ):
                                     is_sentence_end = True
-                                    logger.debug(f"[{task_id}] 检测到静音帧，判断句子结束")
+                                    logger.debug("[%s] 检测到静音帧，判断句子结束", task_id)
 
                                 if is_sentence_end and sentence_active:
-                                    (
-                                        _,
-                                        flush_result_text_raw,
-                                        _,
-                                        _,
-                                        audio_cache,
-                                        audio_time,
-                                    ) = await self._process_audio_chunk(
-                                        b"",
-                                        audio_cache,
-                                        punc_cache,
-                                        transcription_params,
-                                        audio_time,
-                                        task_id,
-                                        is_final=True,
-                                    )
+                                    # 句内尚无任何识别文本时 flush 也不会产出内容, 省掉一次模型调用;
+                                    # 子服务会话仍由下方 _close_http_session_in_cache 关闭
+                                    if sentence_texts_raw:
+                                        (
+                                            _,
+                                            flush_result_text_raw,
+                                            _,
+                                            _,
+                                            audio_time,
+                                        ) = await self._process_audio_chunk(
+                                            _EMPTY_AUDIO,
+                                            audio_cache,
+                                            punc_cache,
+                                            transcription_params,
+                                            audio_time,
+                                            task_id,
+                                            is_final=True,
+                                        )
+                                    else:
+                                        flush_result_text_raw = ""
 
                                     if flush_result_text_raw:
-                                        if _is_qwen3 is None:
-                                            from .asr.http_engine import Qwen3AsrVllmHttpEngine
-
-                                            _is_qwen3 = isinstance(
-                                                self.asr_engine, Qwen3AsrVllmHttpEngine
-                                            )
-
                                         if _is_qwen3:
                                             sentence_texts_raw = [flush_result_text_raw]
                                         elif (
@@ -445,9 +690,7 @@ class AliyunWebSocketASRService:
                                     sentence_duration = audio_time - sentence_start_time
                                     full_sentence_text = "".join(sentence_texts_raw)
 
-                                    if transcription_params.get(
-                                        "enable_punctuation_prediction", True
-                                    ):
+                                    if punctuation_enabled:
                                         full_sentence_text = (
                                             await self._apply_final_punctuation_to_sentence(
                                                 full_sentence_text, task_id
@@ -455,51 +698,42 @@ class AliyunWebSocketASRService:
                                         )
 
                                     logger.debug(
-                                        f"[{task_id}] 句子结束 #{sentence_index}: '{full_sentence_text}' "
-                                        f"({sentence_duration}ms)"
+                                        "[%s] 句子结束 #%d: '%s' (%dms)",
+                                        task_id,
+                                        sentence_index,
+                                        full_sentence_text,
+                                        sentence_duration,
                                     )
                                     await self._send_sentence_end(
-                                        websocket,
+                                        sender,
                                         task_id,
                                         sentence_index,
                                         audio_time,
                                         full_sentence_text,
                                         sentence_start_time,
-                                        enable_itn=transcription_params.get(
-                                            "enable_inverse_text_normalization", True
-                                        ),
+                                        enable_itn=itn_enabled,
                                     )
                                     sentence_active = False
                                     sentence_start_time = 0
-                                    last_sentence_text = ""
-                                    sentence_texts = []
+                                    last_result_text = ""
+                                    sentence_text_acc = ""
                                     sentence_texts_raw = []
                                     empty_result_count = 0
+                                    # 原地清空: 缓存字典整个连接只分配一次
                                     self._close_http_session_in_cache(audio_cache)
-                                    audio_cache = {}
-                                    punc_cache = {}
+                                    audio_cache.clear()
+                                    punc_cache.clear()
                                 elif result_text:
-                                    if result_text != last_sentence_text:
-                                        last_sentence_text = result_text
-
-                                        if _is_qwen3 is None:
-                                            from .asr.http_engine import Qwen3AsrVllmHttpEngine
-
-                                            _is_qwen3 = isinstance(
-                                                self.asr_engine, Qwen3AsrVllmHttpEngine
-                                            )
-
+                                    # 与上一次的识别文本相同则跳过
+                                    if result_text != last_result_text:
+                                        last_result_text = result_text
                                         if _is_qwen3:
                                             # Qwen3-ASR 每次返回全量修正文本，直接替换
-                                            sentence_texts = [result_text]
+                                            sentence_text_acc = result_text
                                             sentence_texts_raw = [result_text_raw]
                                         else:
                                             # FunASR 返回增量文本，追加拼接
-                                            if (
-                                                not sentence_texts
-                                                or result_text != sentence_texts[-1]
-                                            ):
-                                                sentence_texts.append(result_text)
+                                            sentence_text_acc += result_text
                                             if (
                                                 not sentence_texts_raw
                                                 or result_text_raw != sentence_texts_raw[-1]
@@ -509,30 +743,28 @@ class AliyunWebSocketASRService:
                                         if not sentence_active:
                                             sentence_active = True
                                             sentence_start_time = chunk_start_time
-                                            sentence_texts = [result_text]
-                                            sentence_texts_raw = [result_text_raw]
                                             empty_result_count = 0
                                             logger.debug(
-                                                f"[{task_id}] 句子开始 #{sentence_index + 1}"
+                                                "[%s] 句子开始 #%d", task_id, sentence_index + 1
                                             )
+                                            # 不与下方 ResultChanged 用 asyncio.gather 并发发送:
+                                            # 同一 WebSocket 上并发 send 不保证帧序, 而协议要求
+                                            # SentenceBegin 先到; 两次 send 只是写本地发送缓冲, 无往返等待
                                             await self._send_sentence_begin(
-                                                websocket,
+                                                sender,
                                                 task_id,
                                                 sentence_index + 1,
                                                 sentence_start_time,
                                             )
 
-                                        if transcription_params.get(
-                                            "enable_intermediate_result", True
-                                        ):
+                                        if intermediate_enabled:
                                             # 发送当前句子的累计完整文本（去重拼接）
-                                            accumulated_text = "".join(sentence_texts)
                                             await self._send_transcription_result_changed(
-                                                websocket,
+                                                sender,
                                                 task_id,
                                                 sentence_index + 1,
                                                 audio_time,
-                                                accumulated_text,
+                                                sentence_text_acc,
                                             )
 
                         except WebSocketDisconnect:
@@ -542,15 +774,15 @@ class AliyunWebSocketASRService:
                         except Exception as e:
                             logger.error(f"[{task_id}] 音频处理异常: {e}")
                             await self._send_task_failed(
-                                websocket, task_id, f"Audio processing failed: {str(e)}"
+                                sender, task_id, f"Audio processing failed: {str(e)}"
                             )
                             self._close_http_session_in_cache(audio_cache)
-                            audio_cache = {}
-                            punc_cache = {}
+                            audio_cache.clear()
+                            punc_cache.clear()
                             break
                     else:
                         await self._send_task_failed(
-                            websocket, task_id, "Connection not started"
+                            sender, task_id, "Connection not started"
                         )
 
         except WebSocketDisconnect:
@@ -567,13 +799,30 @@ class AliyunWebSocketASRService:
             else:
                 logger.error(f"[{task_id}] WebSocket ASR连接处理异常: {e}")
                 try:
-                    await self._send_task_failed(websocket, task_id, str(e))
+                    await self._send_task_failed(sender, task_id, str(e))
                 except:
                     pass
         finally:
+            if reader_task is not None:
+                reader_task.cancel()
+            await sender.aclose()
             # 关闭 HTTP 子服务的内部 WS session(若有)
             self._close_http_session_in_cache(audio_cache)
 
+    @staticmethod
+    async def _receive_messages(websocket, inbox: asyncio.Queue) -> None:
+        """后台收包: 把客户端消息依次放入 inbox
+
+        receive 抛出的异常(断开等)也放入 inbox, 由处理循环按原逻辑重新抛出。
+        """
+        try:
+            while True:
+                await inbox.put(await websocket.receive())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await inbox.put(e)
+
     def _parse_start_transcription(self, data: dict, task_id: str) -> Optional[dict]:
         """解析StartTranscription消息参数"""
         try:
@@ -581,7 +830,10 @@ class AliyunWebSocketASRService:
 
             params = {
                 "format": payload.get("format", "pcm"),
-                "sample_rate": payload.get("sample_rate", 16000),
+                # 采样率在此规范为 int 并校验, 音频热路径直接使用
+                "sample_rate": self._normalize_sample_rate(
+                    payload.get("sample_rate", 16000)
+                ),
                 "enable_intermediate_result": payload.get(
                     "enable_intermediate_result", True
                 ),
@@ -594,6 +846,14 @@ class AliyunWebSocketASRService:
                 "max_sentence_silence": payload.get("max_sentence_silence", 800),
                 "enable_words": payload.get("enable_words", False),
             }
+            # 实时标点只服务于 TranscriptionResultChanged; 客户端不要中间结果时
+            # 让子服务整段跳过 PUNC 推理, 句末仍由 _apply_final_punctuation_to_sentence 补标点。
+            # 连接内不变, 在此算好, 每个 chunk 直接读取
+            params["enable_realtime_punc"] = bool(
+                settings.ASR_ENABLE_REALTIME_PUNC
+                and params["enable_punctuation_prediction"]
+                and params["enable_intermediate_result"]
+            )
 
             logger.info(f"[{task_id}] StartTranscription参数解析成功: {params}")
             return params
@@ -602,8 +862,24 @@ class AliyunWebSocketASRService:
             logger.error(f"[{task_id}] 解析StartTranscription失败: {e}")
             return None
 
+    @staticmethod
+    def _normalize_sample_rate(sample_rate_value) -> int:
+        """把客户端传入的 sample_rate(int / 数字字符串 / 列表)规范为 int"""
+        if isinstance(sample_rate_value, (list, tuple)):
+            sample_rate_value = sample_rate_value[0] if sample_rate_value else 16000
+        if isinstance(sample_rate_value, str):
+            sample_rate_value = sample_rate_value.strip()
+            if sample_rate_value.isdigit():
+                sample_rate_value = int(sample_rate_value)
+            else:
+                raise Exception(f"无效的采样率参数: {sample_rate_value}")
+        try:
+            return int(sample_rate_value)
+        except (TypeError, ValueError):
+            raise Exception(f"无效的采样率类型: {sample_rate_value}")
+
     def _is_silence_frame(
-        self, audio_array: np.ndarray, threshold: float = 0.001
+        self, audio_array: np.ndarray, threshold: float = _SILENCE_THRESHOLD
     ) -> bool:
         """检测音频帧是否为静音（优化版）
 
@@ -617,102 +893,91 @@ class AliyunWebSocketASRService:
         if len(audio_array) == 0:
             return True
 
-        # 使用更快的最大振幅检测，避免计算RMS
-        max_amplitude = np.max(np.abs(audio_array))
-
-        # 如果最大振幅都很低，直接判定为静音，无需进一步计算
-        return max_amplitude < threshold * 2
+        # 使用更快的最大振幅检测，避免计算RMS;
+        # 单遍扫描, 任一样本超过阈值即提前返回(有声帧通常只看几个样本)
+        limit = threshold * 2
+        samples = np.ascontiguousarray(audio_array, dtype=np.float32).ravel()
+        return abs_max_until(samples, limit) < limit
 
     async def _process_audio_chunk(
         self,
-        audio_bytes: bytes,
+        audio_array: np.ndarray,
         cache: Dict,
         punc_cache: Dict,
         params: dict,
         current_audio_time: int,
         task_id: str,
         is_final: bool = False,
-    ) -> tuple[str, str, bool, bool, Dict, int]:
-        """处理音频块，返回带标点文本、无标点文本、是否句子结束、是否静音帧、缓存、音频时长"""
+        precomputed_rms: Optional[float] = None,
+        chunk_duration_ms: Optional[int] = None,
+    ) -> tuple[str, str, bool, bool, int]:
+        """处理音频块，返回带标点文本、无标点文本、是否句子结束、是否静音帧、音频时长
+
+        cache 由模型原地修改, 整个连接只用同一个 dict, 不在返回值里回传
+
+        audio_array: 接收循环切出的 float32 chunk(pcm / wav 均已解码), 直接送模型,
+            int16 量化只在 send_chunk 发往子服务时做一次
+        precomputed_rms: 调用方远场过滤已算出的本块 RMS, 用于跳过静音帧扫描
+        chunk_duration_ms: 调用方按 chunk 大小查表得到的时长, 缺省时按样本数现算
+        """
         try:
             asr_engine = self._ensure_asr_engine()
 
-            audio_format = params.get("format", "pcm").lower()
-            sample_rate_value = params.get("sample_rate", 16000)
-            if isinstance(sample_rate_value, (list, tuple)):
-                sample_rate_value = sample_rate_value[0] if sample_rate_value else 16000
-            if isinstance(sample_rate_value, str):
-                sample_rate_value = sample_rate_value.strip()
-                if sample_rate_value.isdigit():
-                    sample_rate_value = int(sample_rate_value)
-                else:
-                    raise Exception(f"无效的采样率参数: {sample_rate_value}")
-            try:
-                sample_rate = int(sample_rate_value)
-            except (TypeError, ValueError):
-                raise Exception(f"无效的采样率类型: {sample_rate_value}")
-
-            if audio_format == "pcm":
-                audio_array = (
-                    np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32)
-                    / 32768.0
-                )
-            elif audio_format == "wav":
-                audio_io = io.BytesIO(audio_bytes)
-                audio_array, sr = sf.read(audio_io)
-                if sr != sample_rate:
-                    logger.warning(f"WAV采样率 {sr} 与配置 {sample_rate} 不一致")
-            else:
-                raise Exception(f"暂不支持的音频格式: {audio_format}")
-
-            audio_array = np.asarray(audio_array, dtype=np.float32)
+            sample_rate = params["sample_rate"]
 
-            chunk_duration_ms = int(len(audio_array) / sample_rate * 1000)
+            if chunk_duration_ms is None:
+                chunk_duration_ms = int(len(audio_array) / sample_rate * 1000)
             new_audio_time = current_audio_time + chunk_duration_ms
 
-            # 计算音频能量用于调试
-            max_amplitude = np.max(np.abs(audio_array)) if len(audio_array) > 0 else 0
-            mean_amplitude = np.mean(np.abs(audio_array)) if len(audio_array) > 0 else 0
+            # 幅度信息由远场过滤(RMS)与静音帧检测(max|x|)给出, 这里不再单独扫描
             logger.debug(
-                f"[{task_id}] 音频块信息: samples={len(audio_array)}, "
-                f"duration={chunk_duration_ms}ms, max={max_amplitude:.4f}, mean={mean_amplitude:.6f}"
+                "[%s] 音频块信息: samples=%d, duration=%dms",
+                task_id,
+                len(audio_array),
+                chunk_duration_ms,
             )
 
             # 只在音频块足够大（>=400ms）时才检测静音帧，避免对小块音频进行检测增加延迟
             # 静音帧检测主要用于主动结束句子，不需要对每个小块都检测
             is_silence = False
             if chunk_duration_ms >= 400:
-                is_silence = self._is_silence_frame(audio_array)
-                logger.debug(f"[{task_id}] 静音帧检测: is_silence={is_silence}")
+                if precomputed_rms is not None and precomputed_rms > _SILENCE_THRESHOLD * 2:
+                    # max|x| >= RMS: RMS 已超过静音阈值则必然不是静音帧, 省一次全量扫描
+                    is_silence = False
+                else:
+                    is_silence = self._is_silence_frame(audio_array)
+                logger.debug("[%s] 静音帧检测: is_silence=%s", task_id, is_silence)
 
             # 根据实际音频样本数自适应调整chunk_size
             # chunk_stride = chunk_size[1], FunASR期望: samples ≈ chunk_stride * 960
             # 支持的标准chunk_stride: 4 (3840 samples, 240ms), 10 (9600 samples, 600ms)
             num_samples = len(audio_array)
 
-            # 计算最接近的chunk_stride
-            if num_samples == 3840:
+            # 计算最接近的chunk_stride(整数四舍五入, 限制在4-10之间)
+            chunk_stride = (num_samples + 480) // 960
+            if chunk_stride < 4:
                 chunk_stride = 4
-            elif num_samples == 9600:
+            elif chunk_stride > 10:
                 chunk_stride = 10
-            else:
-                # 自动选择最接近的标准stride
-                chunk_stride = round(num_samples / 960)
-                chunk_stride = max(4, min(chunk_stride, 10))  # 限制在4-10之间
 
-            chunk_size = [0, chunk_stride, 5]
+            chunk_size = _CHUNK_SIZE_BY_STRIDE[chunk_stride]
             encoder_chunk_look_back = 4
             decoder_chunk_look_back = 1
 
             logger.debug(
-                f"[{task_id}] 使用chunk_size={chunk_size} (samples={num_samples}, "
-                f"stride={chunk_stride}, expected={chunk_stride * 960})"
+                "[%s] 使用chunk_size=%s (samples=%d, stride=%d, expected=%d)",
+                task_id,
+                chunk_size,
+                num_samples,
+                chunk_stride,
+                chunk_stride * 960,
             )
 
             # 使用线程池执行模型推理，避免阻塞事件循环
-            # 透传 sample_rate / format, 避免 _HttpRealtimeModel 硬编码 16000/pcm
-            # 否则客户端送 8kHz 时, 子服务会按 16kHz 解析得到错乱采样
-            result = await run_sync(
+            # 透传 sample_rate, 避免 _HttpRealtimeModel 硬编码 16000,
+            # 否则客户端送 8kHz 时, 子服务会按 16kHz 解析得到错乱采样;
+            # send_chunk 送出的始终是 PCM16, 故 format 固定为 pcm(wav 头已在网关剥离)
+            result = await run_sync_realtime(
                 asr_engine.realtime_model.generate,
                 input=audio_array,
                 cache=cache,
@@ -721,36 +986,36 @@ class AliyunWebSocketASRService:
                 encoder_chunk_look_back=encoder_chunk_look_back,
                 decoder_chunk_look_back=decoder_chunk_look_back,
                 sample_rate=sample_rate,
-                format=audio_format,
+                format="pcm",
+                enable_realtime_punc=params["enable_realtime_punc"],
             )
 
-            logger.debug(f"[{task_id}] ASR模型返回结果: {result}")
+            logger.debug("[%s] ASR模型返回结果: %s", task_id, result)
 
             result_text_raw = ""
             result_text_with_punc = ""
             is_sentence_end = False
 
             if result and len(result) > 0:
-                result_text_raw = result[0].get("text", "").strip()
+                item = result[0]
+                # 文本首尾无空白时 str.strip() 直接返回原对象, 不产生新字符串,
+                # 比手写首尾字符预检更快, 故保留
+                result_text_raw = (item.get("text") or "").strip()
                 result_text_with_punc = result_text_raw
 
                 # 实时标点: HTTP 引擎返回 _text_punc(子服务侧已应用 settings.ASR_ENABLE_REALTIME_PUNC)
-                punc_from_http = (result[0].get("_text_punc") or "").strip()
-                if (
-                    punc_from_http
-                    and params.get("enable_punctuation_prediction", True)
-                ):
+                punc_from_http = (item.get("_text_punc") or "").strip()
+                if punc_from_http and params["enable_punctuation_prediction"]:
                     result_text_with_punc = punc_from_http
 
             if result_text_with_punc:
-                logger.debug(f"[{task_id}] 识别: '{result_text_with_punc}'")
+                logger.debug("[%s] 识别: '%s'", task_id, result_text_with_punc)
 
             return (
                 result_text_with_punc,
                 result_text_raw,
                 is_sentence_end,
                 is_silence,
-                cache,
                 new_audio_time,
             )
 
@@ -765,21 +1030,20 @@ class AliyunWebSocketASRService:
 
         全部走子服务: FunASRHttpEngine.punc_offline 调子服务 /asr/punc;
         Qwen3AsrVllmHttpEngine 模型自带标点直接返回;其余引擎退化为原文。
+        单字句或已以句末标点结尾的句子, 离线标点收益很小, 不再调用子服务。
         """
-        if not text:
+        if len(text) < 2 or self._is_sentence_boundary(text):
             return text
 
         try:
-            from .asr.http_engine import FunASRHttpEngine, Qwen3AsrVllmHttpEngine
-
             asr_engine = self._ensure_asr_engine()
 
             if isinstance(asr_engine, Qwen3AsrVllmHttpEngine):
                 return text
 
             if isinstance(asr_engine, FunASRHttpEngine):
-                logger.debug(f"[{task_id}] 通过 HTTP 子服务应用标点: '{text}'")
-                return await run_sync(asr_engine.punc_offline, text) or text
+                logger.debug("[%s] 通过 HTTP 子服务应用标点: '%s'", task_id, text)
+                return await run_sync_realtime(asr_engine.punc_offline, text) or text
 
             logger.debug(f"[{task_id}] 当前引擎类型不支持离线 PUNC,返回原文")
             return text
@@ -789,17 +1053,14 @@ class AliyunWebSocketASRService:
 
     def _is_sentence_boundary(self, text: str) -> bool:
         """判断是否为句子边界（包含句末标点）"""
-        if not text:
-            return False
-        sentence_endings = ["。", "！", "？", ".", "!", "?", "…"]
-        return any(text.endswith(ending) for ending in sentence_endings)
+        return text.endswith(_SENTENCE_ENDINGS)
 
     def _close_http_session_in_cache(self, cache: Dict) -> None:
         """若 cache 中存在 HTTP 子服务 session,关闭它并移除。
 
         FunASRHttpEngine 用 __funasr_http_session__,Qwen3AsrVllmHttpEngine
-        用 __qwen3_asr_http_session__。每次 SentenceEnd 后网关会重置
-        audio_cache,所以这里需要在重置前显式 close,避免内部 WS 泄漏。
+        用 __qwen3_asr_http_session__。每次 SentenceEnd 后网关会清空
+        audio_cache,所以这里需要在清空前显式 close,避免内部 WS 泄漏。
         """
         if not cache:
             return
@@ -811,6 +1072,38 @@ class AliyunWebSocketASRService:
                 except Exception as exc:
                     logger.debug(f"关闭 HTTP session 异常 ({key}): {exc}")
 
+    def _append_audio(
+        self,
+        audio_buffer: _AudioRingBuffer,
+        audio_bytes: bytes,
+        audio_format: str,
+        sample_rate: int,
+        task_id: str,
+    ) -> int:
+        """把一个音频包写入缓冲区, 返回写入的样本数"""
+        if audio_format == "pcm" or (
+            audio_format == "wav" and not audio_bytes.startswith(b"RIFF")
+        ):
+            # 流式 WAV 只有首帧带 RIFF 头, 后续帧即裸 PCM16, 不再经 soundfile 解析
+            return audio_buffer.extend_pcm16(audio_bytes)
+        if audio_format == "wav":
+            # io.BytesIO(bytes) 与原 bytes 共享内存(写入前不拷贝), 复用 BytesIO 反而要
+            # write 一次整包; 且流式 WAV 只有首包走到这里, 不做池化
+            with sf.SoundFile(io.BytesIO(audio_bytes)) as sound_file:
+                if sound_file.samplerate != sample_rate:
+                    logger.warning(
+                        f"[{task_id}] WAV采样率 {sound_file.samplerate} 与配置 {sample_rate} 不一致"
+                    )
+                if sound_file.channels == 1:
+                    # 每帧至少占 1 字节, 以包长作为帧数上限
+                    return audio_buffer.extend_soundfile(sound_file, len(audio_bytes))
+                return audio_buffer.extend(sound_file.read(dtype="float32"))
+        return audio_buffer.extend(
+            self._convert_audio_bytes_to_array(
+                audio_bytes, audio_format, sample_rate, task_id
+            )
+        )
+
     def _convert_audio_bytes_to_array(
         self, audio_bytes: bytes, audio_format: str, sample_rate: int, task_id: str
     ) -> np.ndarray:
@@ -826,39 +1119,32 @@ class AliyunWebSocketASRService:
             float32的numpy数组，范围-1.0到1.0
         """
         if audio_format == "pcm":
-            audio_array = (
-                np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32)
-                / 32768.0
-            )
+            audio_array = _pcm16_to_float32(audio_bytes)
         elif audio_format == "wav":
             audio_io = io.BytesIO(audio_bytes)
-            audio_array, sr = sf.read(audio_io)
+            # 直接解码为 float32, 省去 float64 中间数组与再次转换
+            audio_array, sr = sf.read(audio_io, dtype="float32")
             if sr != sample_rate:
                 logger.warning(f"[{task_id}] WAV采样率 {sr} 与配置 {sample_rate} 不一致")
         else:
             raise Exception(f"暂不支持的音频格式: {audio_format}")
 
-        return np.asarray(audio_array, dtype=np.float32)
+        return audio_array
 
     async def _send_transcription_started(
         self, websocket, task_id: str, session_id: str
     ):
         """发送TranscriptionStarted响应"""
         response = {
-            "header": {
-                "message_id": AliyunASRWSHeader.generate_message_id(),
-                "task_id": task_id,
-                "namespace": AliyunASRNamespace.SPEECH_TRANSCRIBER,
-                "name": AliyunASRMessageName.TRANSCRIPTION_STARTED,
-                "status": AliyunASRStatus.SUCCESS,
-                "status_message": "GATEWAY|SUCCESS|Success.",
-            },
+            "header": _success_header(
+                task_id, AliyunASRMessageName.TRANSCRIPTION_STARTED
+            ),
             "payload": {
                 "session_id": session_id,
             },
         }
         try:
-            await websocket.send_text(json.dumps(response, ensure_ascii=False))
+            await websocket.send_text(orjson.dumps(response).decode())
         except Exception as e:
             logger.debug(f"[{task_id}] 发送TranscriptionStarted失败，客户端可能已断开: {e}")
             raise WebSocketDisconnect()
@@ -868,21 +1154,16 @@ class AliyunWebSocketASRService:
     ):
         """发送SentenceBegin响应"""
         response = {
-            "header": {
-                "message_id": AliyunASRWSHeader.generate_message_id(),
-                "task_id": task_id,
-                "namespace": AliyunASRNamespace.SPEECH_TRANSCRIBER,
-                "name": AliyunASRMessageName.SENTENCE_BEGIN,
-                "status": AliyunASRStatus.SUCCESS,
-                "status_message": "GATEWAY|SUCCESS|Success.",
-            },
+            "header": _success_header(
+                task_id, AliyunASRMessageName.SENTENCE_BEGIN
+            ),
             "payload": {
                 "index": index,
                 "time": time,
             },
         }
         try:
-            await websocket.send_text(json.dumps(response, ensure_ascii=False))
+            await websocket.send_text(orjson.dumps(response).decode())
         except Exception as e:
             logger.debug(f"[{task_id}] 发送SentenceBegin失败，客户端可能已断开: {e}")
             raise WebSocketDisconnect()
@@ -892,14 +1173,9 @@ class AliyunWebSocketASRService:
     ):
         """发送TranscriptionResultChanged响应（中间结果）"""
         response = {
-            "header": {
-                "message_id": AliyunASRWSHeader.generate_message_id(),
-                "task_id": task_id,
-                "namespace": AliyunASRNamespace.SPEECH_TRANSCRIBER,
-                "name": AliyunASRMessageName.TRANSCRIPTION_RESULT_CHANGED,
-                "status": AliyunASRStatus.SUCCESS,
-                "status_message": "GATEWAY|SUCCESS|Success.",
-            },
+            "header": _success_header(
+                task_id, AliyunASRMessageName.TRANSCRIPTION_RESULT_CHANGED
+            ),
             "payload": {
                 "index": index,
                 "time": time,
@@ -907,7 +1183,10 @@ class AliyunWebSocketASRService:
             },
         }
         try:
-            await websocket.send_text(json.dumps(response, ensure_ascii=False))
+            # 同一句的中间结果积压时只写最新一条
+            await websocket.send_text(
+                orjson.dumps(response).decode(), replace_key=index
+            )
         except Exception as e:
             logger.debug(f"[{task_id}] 发送TranscriptionResultChanged失败，客户端可能已断开: {e}")
             raise WebSocketDisconnect()
@@ -924,19 +1203,14 @@ class AliyunWebSocketASRService:
     ):
         """发送SentenceEnd响应"""
         if enable_itn and result:
-            logger.debug(f"[{task_id}] 应用ITN: {result}")
+            logger.debug("[%s] 应用ITN: %s", task_id, result)
             result = apply_itn_to_text(result)
-            logger.debug(f"[{task_id}] ITN结果: {result}")
+            logger.debug("[%s] ITN结果: %s", task_id, result)
 
         response = {
-            "header": {
-                "message_id": AliyunASRWSHeader.generate_message_id(),
-                "task_id": task_id,
-                "namespace": AliyunASRNamespace.SPEECH_TRANSCRIBER,
-                "name": AliyunASRMessageName.SENTENCE_END,
-                "status": AliyunASRStatus.SUCCESS,
-                "status_message": "GATEWAY|SUCCESS|Success.",
-            },
+            "header": _success_header(
+                task_id, AliyunASRMessageName.SENTENCE_END
+            ),
             "payload": {
                 "index": index,
                 "time": time,
@@ -945,43 +1219,35 @@ class AliyunWebSocketASRService:
             },
         }
         try:
-            await websocket.send_text(json.dumps(response, ensure_ascii=False))
+            await websocket.send_text(orjson.dumps(response).decode())
         except Exception as e:
             logger.debug(f"[{task_id}] 发送SentenceEnd失败，客户端可能已断开: {e}")
             raise WebSocketDisconnect()
 
     async def _send_transcription_completed(self, websocket, task_id: str):
         """发送TranscriptionCompleted响应"""
-        response = {
-            "header": {
-                "message_id": AliyunASRWSHeader.generate_message_id(),
-                "task_id": task_id,
-                "namespace": AliyunASRNamespace.SPEECH_TRANSCRIBER,
-                "name": AliyunASRMessageName.TRANSCRIPTION_COMPLETED,
-                "status": AliyunASRStatus.SUCCESS,
-                "status_message": "GATEWAY|SUCCESS|Success.",
-            },
-        }
+        # 只有 message_id / task_id 是动态的, 其余部分用预序列化的模板拼接
+        text = (
+            f'{{"header":{{"message_id":"{AliyunASRWSHeader.generate_message_id()}",'
+            f'"task_id":{orjson.dumps(task_id).decode()},{_COMPLETED_HEADER_TAIL}}}'
+        )
         try:
-            await websocket.send_text(json.dumps(response, ensure_ascii=False))
+            await websocket.send_text(text)
         except Exception as e:
             logger.debug(f"[{task_id}] 发送TranscriptionCompleted失败，客户端可能已断开: {e}")
             raise WebSocketDisconnect()
 
     async def _send_task_failed(self, websocket, task_id: str, reason: str):
         """发送TaskFailed响应"""
-        response = {
-            "header": {
-                "namespace": AliyunASRNamespace.SPEECH_TRANSCRIBER,
-                "name": AliyunASRMessageName.TASK_FAILED,
-                "status": AliyunASRStatus.TASK_FAILED,
-                "message_id": AliyunASRWSHeader.generate_message_id(),
-                "task_id": task_id,
-                "status_text": reason,
-            }
-        }
+        # 固定字段用预序列化的模板, 只对 task_id / reason 做 JSON 转义
+        text = (
+            f'{{"header":{{{_TASK_FAILED_HEADER_HEAD},'
+            f'"message_id":"{AliyunASRWSHeader.generate_message_id()}",'
+            f'"task_id":{orjson.dumps(task_id).decode()},'
+            f'"status_text":{orjson.dumps(reason).decode()}}}}}'
+        )
         try:
-            await websocket.send_text(json.dumps(response, ensure_ascii=False))
+            await websocket.send_text(text)
             logger.error(f"[{task_id}] 发送TaskFailed: {reason}")
         except:
             pass
@@ -3,13 +3,14 @@
 WebSocket TTS 服务 - 阿里云流式语音合成协议实现
 """
 
-import json
 import asyncio
 import logging
-from typing import Optional, AsyncGenerator, Dict, Any
+import struct
+from typing import Optional, AsyncGenerator, Dict, Any, Union
 from enum import IntEnum
 
 import numpy as np
+import orjson
 from fastapi import WebSocketDisconnect
 
 from ..core.config import settings
@@ -31,10 +32,71 @@ from ..utils.common import (
     convert_speech_rate_to_speed,
 )
 from ..utils.audio import validate_audio_format, validate_sample_rate, resample_audio_array
+from ..utils.audio_kernels import float32_to_pcm16_clip
 from .tts.engine import get_tts_engine
+from .ws_sender import QueuedSender
 
 logger = logging.getLogger(__name__)
 
+# PCM 下行帧的最小时长(毫秒): 首块立即发出保证首包延迟, 之后的小块攒够再发,
+# 减少 WebSocket 帧数与 send 次数
+_PCM_FRAME_MIN_MS = 100
+
+# 攒帧的最长等待(秒): 模型产出慢于实时时, 距上次下发超过该时长就不再等满最小帧长
+_PCM_FLUSH_INTERVAL_S = 0.04
+
+# 合成块队列上限: 模型领先 socket 太多时让生产者等待, 而不是无限堆积
+_AUDIO_QUEUE_MAXSIZE = 32
+
+# 合成块队列的结束标记
+_STREAM_END = object()
+
+
+
+# 成功响应 header 中除 message_id / task_id / name 外的固定字段
+_SUCCESS_STATUS_MESSAGE = "GATEWAY|SUCCESS|Success."
+
+# TaskFailed header 的固定开头(已序列化, 不含两侧括号)
+_TASK_FAILED_HEADER_HEAD = orjson.dumps(
+    {
+        "namespace": AliyunTTSNamespace.DEFAULT,
+        "name": AliyunTTSMessageName.TASK_FAILED,
+        "status": AliyunTTSStatus.TASK_FAILED,
+    }
+).decode()[1:-1]
+
+
+def _success_header(task_id: str, name: str) -> dict:
+    """构建成功响应的 header: 固定字段取模块常量, 只填 message_id / task_id / name"""
+    return {
+        "message_id": AliyunWSHeader.generate_message_id(),
+        "task_id": task_id,
+        "namespace": AliyunTTSNamespace.FLOWING_SPEECH_SYNTHESIZER,
+        "name": name,
+        "status": AliyunTTSStatus.SUCCESS,
+        "status_message": _SUCCESS_STATUS_MESSAGE,
+    }
+
+
+def _streaming_wav_header(sample_rate: int) -> bytes:
+    """流式 WAV 文件头(mono / PCM16), 总长未知, RIFF 与 data 长度按惯例填 0xFFFFFFFF"""
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        0xFFFFFFFF,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        1,
+        sample_rate,
+        sample_rate * 2,
+        2,
+        16,
+        b"data",
+        0xFFFFFFFF,
+    )
+
 
 class ConnectionState(IntEnum):
     """连接状态"""
@@ -71,6 +133,8 @@ class AliyunWebSocketTTSService:
         state = ConnectionState.READY
         session_id = f"session_{task_id}"
         synthesis_params = None
+        # 所有下行消息经发送队列由后台 writer 写出
+        sender = QueuedSender(websocket)
 
         logger.debug(f"[{task_id}] 阿里云WebSocket连接开始处理")
 
@@ -80,7 +144,7 @@ class AliyunWebSocketTTSService:
                 x_nls_token = websocket.headers.get("X-NLS-Token")
                 if settings.APPTOKEN and not x_nls_token:
                     await self._send_task_failed(
-                        websocket, task_id, "X-NLS-Token not found in ws header"
+                        sender, task_id, "X-NLS-Token not found in ws header"
                     )
                     return
 
@@ -88,7 +152,7 @@ class AliyunWebSocketTTSService:
                 if x_nls_token:
                     result, message = validate_token_websocket(x_nls_token, task_id)
                     if not result:
-                        await self._send_task_failed(websocket, task_id, message)
+                        await self._send_task_failed(sender, task_id, message)
                         return
 
             while True:
@@ -97,7 +161,7 @@ class AliyunWebSocketTTSService:
 
                 try:
                     # 解析消息
-                    data = json.loads(message)
+                    data = orjson.loads(message)
                     logger.debug(f"[{task_id}] 收到消息: {data}")
 
                     header = data.get("header", {})
@@ -108,7 +172,7 @@ class AliyunWebSocketTTSService:
                     # 验证namespace
                     if namespace != AliyunTTSNamespace.FLOWING_SPEECH_SYNTHESIZER:
                         await self._send_task_failed(
-                            websocket, task_id, "Invalid namespace"
+                            sender, task_id, "Invalid namespace"
                         )
                         continue
 
@@ -123,25 +187,25 @@ class AliyunWebSocketTTSService:
                                 task_id = message_task_id or task_id
                                 # 发送开始响应
                                 await self._send_synthesis_started(
-                                    websocket, task_id, session_id
+                                    sender, task_id, session_id
                                 )
                                 state = ConnectionState.STARTED
                             else:
                                 await self._send_task_failed(
-                                    websocket,
+                                    sender,
                                     task_id,
                                     "Invalid StartSynthesis parameters",
                                 )
                         else:
                             await self._send_task_failed(
-                                websocket, task_id, "Connection already started"
+                                sender, task_id, "Connection already started"
                             )
 
                     elif message_name == AliyunTTSMessageName.RUN_SYNTHESIS:
                         if state == ConnectionState.STARTED:
                             if message_task_id != task_id:
                                 await self._send_task_failed(
-                                    websocket, task_id, "Task ID not match"
+                                    sender, task_id, "Task ID not match"
                                 )
                                 continue
 
@@ -149,7 +213,7 @@ class AliyunWebSocketTTSService:
                             text = data.get("payload", {}).get("text", "")
                             if text and synthesis_params:
                                 await self._run_synthesis(
-                                    websocket,
+                                    sender,
                                     task_id,
                                     session_id,
                                     text,
@@ -158,41 +222,41 @@ class AliyunWebSocketTTSService:
                                 # 注意：state保持STARTED，允许后续继续发送RunSynthesis
                             else:
                                 await self._send_task_failed(
-                                    websocket, task_id, "Missing text in RunSynthesis"
+                                    sender, task_id, "Missing text in RunSynthesis"
                                 )
                         else:
                             await self._send_task_failed(
-                                websocket, task_id, "Connection not started"
+                                sender, task_id, "Connection not started"
                             )
 
                     elif message_name == AliyunTTSMessageName.STOP_SYNTHESIS:
                         if state == ConnectionState.STARTED:
                             if message_task_id != task_id:
                                 await self._send_task_failed(
-                                    websocket, task_id, "Task ID not match"
+                                    sender, task_id, "Task ID not match"
                                 )
                                 continue
 
                             # 完成合成
                             await self._send_synthesis_completed(
-                                websocket, task_id, session_id
+                                sender, task_id, session_id
                             )
                             state = ConnectionState.COMPLETED
                             logger.debug(f"[{task_id}] 阿里云WebSocket合成完成")
                             break
                         else:
                             await self._send_task_failed(
-                                websocket, task_id, "Connection not started"
+                                sender, task_id, "Connection not started"
                             )
                     else:
                         await self._send_task_failed(
-                            websocket, task_id, f"Invalid message name: {message_name}"
+                            sender, task_id, f"Invalid message name: {message_name}"
                         )
 
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     logger.error(f"[{task_id}] JSON解析错误: {e}")
                     await self._send_task_failed(
-                        websocket, task_id, f"Message Not Json: {message}"
+                        sender, task_id, f"Message Not Json: {message}"
                     )
                 except WebSocketDisconnect:
                     # 客户端断开，向外层抛出
@@ -200,7 +264,7 @@ class AliyunWebSocketTTSService:
                     raise
                 except Exception as e:
                     logger.error(f"[{task_id}] 处理消息异常: {e}")
-                    await self._send_task_failed(websocket, task_id, str(e))
+                    await self._send_task_failed(sender, task_id, str(e))
                     break
 
         except WebSocketDisconnect:
@@ -213,9 +277,11 @@ class AliyunWebSocketTTSService:
             else:
                 logger.error(f"[{task_id}] WebSocket连接处理异常: {e}")
                 try:
-                    await self._send_task_failed(websocket, task_id, str(e))
+                    await self._send_task_failed(sender, task_id, str(e))
                 except:
                     pass
+        finally:
+            await sender.aclose()
 
     def _parse_start_synthesis(self, data: dict, task_id: str) -> Optional[dict]:
         """解析StartSynthesis消息"""
@@ -235,11 +301,17 @@ class AliyunWebSocketTTSService:
             }
 
             # 验证参数
-            if not validate_audio_format(params["format"].lower()):
+            if not validate_audio_format(params["format"]):
                 return None
             if not validate_sample_rate(params["sample_rate"]):
                 return None
 
+            # 会话级派生参数在 StartSynthesis 时算一次, 之后每次 RunSynthesis 直接复用
+            params["speed"] = convert_speech_rate_to_speed(params["speech_rate"])
+            params["pcm_frame_min_bytes"] = (
+                int(params["sample_rate"]) * 2 * _PCM_FRAME_MIN_MS // 1000
+            )
+
             logger.info(f"[{task_id}] StartSynthesis参数解析成功: {params}")
             return params
 
@@ -248,58 +320,149 @@ class AliyunWebSocketTTSService:
             return None
 
     async def _run_synthesis(
-        self, websocket, task_id: str, session_id: str, text: str, params: dict
+        self,
+        sender: QueuedSender,
+        task_id: str,
+        session_id: str,
+        text: str,
+        params: dict,
     ):
         """执行流式合成"""
         logger.debug(f"[{task_id}] 开始流式合成文本: '{text}'")
 
         try:
             # 发送句子开始
-            await self._send_sentence_begin(websocket, task_id, session_id)
+            await self._send_sentence_begin(sender, task_id, session_id)
+
+            # 整句字幕(估算时长), 序列化一次, SentenceSynthesis 与 SentenceEnd 共用
+            subtitles_payload = orjson.dumps(
+                {
+                    "subtitles": [
+                        {
+                            "text": text,
+                            "begin_time": 0,
+                            "end_time": len(text) * 200,  # 估算时长
+                            "begin_index": 0,
+                            "end_index": len(text),
+                            "sentence": True,
+                            "phoneme_list": [],
+                        }
+                    ]
+                }
+            ).decode()
 
             # 清理文本
             clean_text = clean_text_for_tts(text)
-            speed = convert_speech_rate_to_speed(params["speech_rate"])
-            prompt = params.get("prompt", "")
 
-            # 生成音频
+            # 生成音频: 生产者把合成块写入有界队列, 这里先阻塞等第一块, 再把
+            # 已就绪的块非阻塞地一并取出合并发送 — 模型慢时不增加延迟, 模型
+            # 快于 socket 时自动攒批
             audio_sent = False
-            async for audio_chunk in self._synthesize_streaming_audio(
-                clean_text,
-                params["voice"],
-                speed,
-                params["format"],
-                params["sample_rate"],
-                params["volume"],
-                task_id,
-                websocket,  # 传入websocket用于检测连接状态
-                prompt,  # 传入 prompt 参数
-            ):
-                if audio_chunk and len(audio_chunk) > 0:
-                    # 检查WebSocket连接状态
-                    if websocket.client_state.name != "CONNECTED":
-                        logger.warning(
-                            f"[{task_id}] 检测到客户端已断开，停止合成"
+            # PCM 与流式 WAV(仅首块带头)都是连续的 PCM16 字节流, 相邻块可直接拼接
+            pcm_frame_min_bytes = params["pcm_frame_min_bytes"]
+            pending_pcm = bytearray()
+            loop = asyncio.get_running_loop()
+            last_flush = 0.0
+            chunks: asyncio.Queue = asyncio.Queue(maxsize=_AUDIO_QUEUE_MAXSIZE)
+            producer = asyncio.create_task(
+                self._produce_audio_chunks(
+                    chunks,
+                    clean_text,
+                    params["voice"],
+                    params["speed"],
+                    params["format"],
+                    params["sample_rate"],
+                    params["volume"],
+                    task_id,
+                    params["prompt"],  # 传入 prompt 参数
+                )
+            )
+            # 取块任务跨轮次保留: 等待超时只放弃这一轮等待, 不会取消 get 而丢块
+            get_task = None
+            try:
+                finished = False
+                failure = None
+                while not finished:
+                    if get_task is None:
+                        get_task = asyncio.ensure_future(chunks.get())
+                    if pending_pcm:
+                        # 有未发送的 PCM 时最多等到下发期限, 模型卡住也按时 flush
+                        await asyncio.wait(
+                            (get_task,),
+                            timeout=max(
+                                0.0, _PCM_FLUSH_INTERVAL_S - (loop.time() - last_flush)
+                            ),
                         )
-                        return
+                    else:
+                        await asyncio.wait((get_task,))
+                    timed_out = not get_task.done()
+                    if timed_out:
+                        batch = []
+                    else:
+                        batch = [get_task.result()]
+                        get_task = None
+                        while not chunks.empty():
+                            batch.append(chunks.get_nowait())
+
+                    # 结束标记 / 生产者异常只会出现在队尾
+                    tail = batch[-1] if batch else None
+                    if tail is _STREAM_END or isinstance(tail, BaseException):
+                        batch.pop()
+                        finished = True
+                        if tail is not _STREAM_END:
+                            failure = tail
+                    if not batch and not ((finished or timed_out) and pending_pcm):
+                        continue
+
+                    # 不再逐块轮询 client_state: 客户端断开时 writer 写失败, 下一次
+                    # send_* 抛出, finally 里取消生产者(连同引擎到子服务的流)
+                    for audio_chunk in batch:
+                        pending_pcm += audio_chunk
+                    # 首块立即发出; 之后攒够最小帧长、距上次下发超过最长等待
+                    # 或流结束时再发
+                    if (
+                        audio_sent
+                        and not finished
+                        and not timed_out
+                        and len(pending_pcm) < pcm_frame_min_bytes
+                        and loop.time() - last_flush < _PCM_FLUSH_INTERVAL_S
+                    ):
+                        continue
 
                     # 发送音频数据（二进制）
-                    await websocket.send_bytes(audio_chunk)
+                    await sender.send_bytes(bytes(pending_pcm), merge=True)
+                    pending_pcm.clear()
+                    last_flush = loop.time()
+
+                    # 发送句子合成进度（可选）: 字幕内容整句不变, 只随首帧发一次
+                    if not audio_sent:
+                        await self._send_sentence_synthesis(
+                            sender, task_id, session_id, subtitles_payload
+                        )
                     audio_sent = True
 
-                    # 发送句子合成进度（可选）
-                    await self._send_sentence_synthesis(
-                        websocket, task_id, session_id, text
-                    )
-
                     # 不再人为 sleep — 子服务 yield 节奏 = 客户端接收节奏。
                     # 微服务化后多了一跳网络 RTT,再叠 50ms 是负优化。
 
+                if failure is not None:
+                    raise failure
+            finally:
+                # 等生产者真正退出, 引擎流生成器的 finally(关闭子服务 WS)在下一次
+                # RunSynthesis 之前跑完, 也不会在事件循环关闭时遗留 pending 任务
+                producer.cancel()
+                pending_tasks = [producer]
+                if get_task is not None:
+                    get_task.cancel()
+                    pending_tasks.append(get_task)
+                await asyncio.gather(*pending_tasks, return_exceptions=True)
+
             if not audio_sent:
                 logger.warning(f"[{task_id}] 没有生成任何音频数据")
 
             # 发送句子结束
-            await self._send_sentence_end(websocket, task_id, session_id, text)
+            await self._send_sentence_end(
+                sender, task_id, session_id, subtitles_payload
+            )
 
         except WebSocketDisconnect:
             logger.warning(f"[{task_id}] 客户端在合成过程中断开连接")
@@ -312,9 +475,20 @@ class AliyunWebSocketTTSService:
             else:
                 logger.error(f"[{task_id}] 流式合成失败: {e}")
                 await self._send_task_failed(
-                    websocket, task_id, f"Synthesis failed: {str(e)}"
+                    sender, task_id, f"Synthesis failed: {str(e)}"
                 )
 
+    async def _produce_audio_chunks(self, chunks: asyncio.Queue, *args):
+        """把 _synthesize_streaming_audio 的输出写入队列, 以 _STREAM_END 收尾, 异常随队列交给消费者"""
+        try:
+            async for audio_chunk in self._synthesize_streaming_audio(*args):
+                if audio_chunk:
+                    await chunks.put(audio_chunk)
+        except Exception as exc:
+            await chunks.put(exc)
+        else:
+            await chunks.put(_STREAM_END)
+
     async def _synthesize_streaming_audio(
         self,
         text: str,
@@ -324,9 +498,8 @@ class AliyunWebSocketTTSService:
         sample_rate: int,
         volume: int,
         task_id: str,
-        websocket,
         prompt: str = "",
-    ) -> AsyncGenerator[Optional[bytes], None]:
+    ) -> AsyncGenerator[Union[bytes, memoryview], None]:
         """流式合成 — 通过当前 TTS 引擎的 iter_stream_audio_chunks 能力输出"""
         tts_engine = self._ensure_tts_engine()
 
@@ -337,19 +510,23 @@ class AliyunWebSocketTTSService:
                 "请确认当前 TTS_ENGINE 支持 iter_stream_audio_chunks"
             )
 
+        # 循环不变量提到循环外: 逐块只做重采样(采样率不同时)与量化
+        sample_rate = int(sample_rate)
+        convert = self._convert_audio_to_pcm
+        # WAV 按流式 WAV 输出: 首块前带一次文件头, 之后都是裸 PCM16
+        wav_header = b"" if format.upper() == "PCM" else _streaming_wav_header(sample_rate)
+
         try:
             async for audio_array, native_sr in iter_stream_audio_chunks(
                 text=text, voice=voice, speed=speed, prompt=prompt
             ):
-                if websocket.client_state.name != "CONNECTED":
-                    logger.warning(f"[{task_id}] 客户端已断开,停止流式合成")
-                    return
-
-                audio_array = resample_audio_array(audio_array, native_sr, sample_rate)
-                if format.upper() == "PCM":
-                    yield self._convert_audio_to_pcm(audio_array, sample_rate)
-                else:
-                    yield self._convert_audio_to_wav(audio_array, sample_rate)
+                if native_sr != sample_rate:
+                    audio_array = resample_audio_array(audio_array, native_sr, sample_rate)
+                pcm_bytes = convert(audio_array, sample_rate)
+                if wav_header and pcm_bytes:
+                    pcm_bytes = wav_header + pcm_bytes
+                    wav_header = b""
+                yield pcm_bytes
         except WebSocketDisconnect:
             logger.warning(f"[{task_id}] 客户端断开,停止音频生成")
             raise
@@ -357,178 +534,95 @@ class AliyunWebSocketTTSService:
             logger.error(f"[{task_id}] 流式合成失败: {exc}")
             raise
 
-    def _convert_audio_to_pcm(self, audio_array: np.ndarray, sample_rate: int) -> bytes:
-        """将音频数组转换为PCM字节流"""
-        try:
-            if audio_array is None or audio_array.size == 0:
-                return b""
-
-            # 确保音频数据在正确的范围内
-            audio_array = np.clip(audio_array, -1.0, 1.0)
-
-            # 转换为16位PCM
-            pcm_data = (audio_array * 32767).astype(np.int16)
-
-            return pcm_data.tobytes()
-
-        except Exception as e:
-            logger.error(f"PCM转换失败: {e}")
-            return b""
-
-    def _convert_audio_to_wav(self, audio_array: np.ndarray, sample_rate: int) -> bytes:
-        """将音频数组转换为WAV字节流"""
-        import soundfile as sf
-        import io
+    def _convert_audio_to_pcm(
+        self, audio_array: np.ndarray, sample_rate: int
+    ) -> Union[bytes, memoryview]:
+        """将音频数组转换为PCM字节流
 
+        返回 int16 输出数组的字节视图, 不再 tobytes() 拷贝一份; 调用方直接追加进
+        待发送的 bytearray。
+        """
         try:
             if audio_array is None or audio_array.size == 0:
                 return b""
 
-            # 创建内存中的字节流
-            buffer = io.BytesIO()
-
-            # 将音频数组写入内存缓冲区（WAV格式）
-            sf.write(buffer, audio_array.T, sample_rate, format="WAV")
-
-            # 获取字节数据
-            buffer.seek(0)
-            return buffer.read()
+            # 转换为16位PCM: Numba 内核单遍完成 clip + ×32767 + 截断, 只分配输出数组
+            audio = np.ascontiguousarray(audio_array, dtype=np.float32).ravel()
+            pcm_data = np.empty(audio.size, dtype=np.int16)
+            float32_to_pcm16_clip(audio, pcm_data)
+            return memoryview(pcm_data).cast("B")
 
         except Exception as e:
-            logger.error(f"WAV转换失败: {e}")
+            logger.error(f"PCM转换失败: {e}")
             return b""
 
     async def _send_synthesis_started(self, websocket, task_id: str, session_id: str):
         """发送SynthesisStarted响应"""
         response = {
-            "header": {
-                "message_id": AliyunWSHeader.generate_message_id(),
-                "task_id": task_id,
-                "namespace": AliyunTTSNamespace.FLOWING_SPEECH_SYNTHESIZER,
-                "name": AliyunTTSMessageName.SYNTHESIS_STARTED,
-                "status": AliyunTTSStatus.SUCCESS,
-                "status_message": "GATEWAY|SUCCESS|Success.",
-            },
+            "header": _success_header(task_id, AliyunTTSMessageName.SYNTHESIS_STARTED),
             "payload": {
                 "session_id": session_id,
                 "index": 1,
             },
         }
-        await websocket.send_text(json.dumps(response))
+        await websocket.send_text(orjson.dumps(response).decode())
         logger.debug(f"[{task_id}] 发送SynthesisStarted")
 
     async def _send_sentence_begin(self, websocket, task_id: str, session_id: str):
         """发送SentenceBegin响应"""
         response = {
-            "header": {
-                "message_id": AliyunWSHeader.generate_message_id(),
-                "task_id": task_id,
-                "namespace": AliyunTTSNamespace.FLOWING_SPEECH_SYNTHESIZER,
-                "name": AliyunTTSMessageName.SENTENCE_BEGIN,
-                "status": AliyunTTSStatus.SUCCESS,
-                "status_message": "GATEWAY|SUCCESS|Success.",
-            },
+            "header": _success_header(task_id, AliyunTTSMessageName.SENTENCE_BEGIN),
             "payload": {
                 "session_id": session_id,
                 "index": 1,
             },
         }
-        await websocket.send_text(json.dumps(response, ensure_ascii=False))
+        await websocket.send_text(orjson.dumps(response).decode())
         logger.debug(f"[{task_id}] 发送SentenceBegin")
 
     async def _send_sentence_synthesis(
-        self, websocket, task_id: str, session_id: str, text: str
+        self, websocket, task_id: str, session_id: str, subtitles_payload: str
     ):
-        """发送SentenceSynthesis响应"""
-        response = {
-            "header": {
-                "message_id": AliyunWSHeader.generate_message_id(),
-                "task_id": task_id,
-                "namespace": AliyunTTSNamespace.FLOWING_SPEECH_SYNTHESIZER,
-                "name": AliyunTTSMessageName.SENTENCE_SYNTHESIS,
-                "status": AliyunTTSStatus.SUCCESS,
-                "status_message": "GATEWAY|SUCCESS|Success.",
-            },
-            "payload": {
-                "subtitles": [
-                    {
-                        "text": text,
-                        "begin_time": 0,
-                        "end_time": len(text) * 200,  # 估算时长
-                        "begin_index": 0,
-                        "end_index": len(text),
-                        "sentence": True,
-                        "phoneme_list": [],
-                    }
-                ]
-            },
-        }
-        await websocket.send_text(json.dumps(response, ensure_ascii=False))
+        """发送SentenceSynthesis响应, subtitles_payload 为已序列化的 payload"""
+        header = orjson.dumps(
+            _success_header(task_id, AliyunTTSMessageName.SENTENCE_SYNTHESIS)
+        ).decode()
+        await websocket.send_text(f'{{"header":{header},"payload":{subtitles_payload}}}')
         logger.debug(f"[{task_id}] 发送SentenceSynthesis")
 
     async def _send_sentence_end(
-        self, websocket, task_id: str, session_id: str, text: str
+        self, websocket, task_id: str, session_id: str, subtitles_payload: str
     ):
-        """发送SentenceEnd响应"""
-        response = {
-            "header": {
-                "message_id": AliyunWSHeader.generate_message_id(),
-                "task_id": task_id,
-                "namespace": AliyunTTSNamespace.FLOWING_SPEECH_SYNTHESIZER,
-                "name": AliyunTTSMessageName.SENTENCE_END,
-                "status": AliyunTTSStatus.SUCCESS,
-                "status_message": "GATEWAY|SUCCESS|Success.",
-            },
-            "payload": {
-                "subtitles": [
-                    {
-                        "text": text,
-                        "begin_time": 0,
-                        "end_time": len(text) * 200,  # 估算时长
-                        "begin_index": 0,
-                        "end_index": len(text),
-                        "sentence": True,
-                        "phoneme_list": [],
-                    }
-                ]
-            },
-        }
-        await websocket.send_text(json.dumps(response, ensure_ascii=False))
+        """发送SentenceEnd响应, subtitles_payload 为已序列化的 payload"""
+        header = orjson.dumps(
+            _success_header(task_id, AliyunTTSMessageName.SENTENCE_END)
+        ).decode()
+        await websocket.send_text(f'{{"header":{header},"payload":{subtitles_payload}}}')
         logger.debug(f"[{task_id}] 发送SentenceEnd")
 
     async def _send_synthesis_completed(self, websocket, task_id: str, session_id: str):
         """发送SynthesisCompleted响应"""
         response = {
-            "header": {
-                "message_id": AliyunWSHeader.generate_message_id(),
-                "task_id": task_id,
-                "namespace": AliyunTTSNamespace.FLOWING_SPEECH_SYNTHESIZER,
-                "name": AliyunTTSMessageName.SYNTHESIS_COMPLETED,
-                "status": AliyunTTSStatus.SUCCESS,
-                "status_message": "GATEWAY|SUCCESS|Success.",
-            },
+            "header": _success_header(task_id, AliyunTTSMessageName.SYNTHESIS_COMPLETED),
             "payload": {
                 "session_id": session_id,
                 "index": 1,
             },
         }
-        await websocket.send_text(json.dumps(response))
+        await websocket.send_text(orjson.dumps(response).decode())
         logger.debug(f"[{task_id}] 发送SynthesisCompleted")
 
     async def _send_task_failed(self, websocket, task_id: str, reason: str):
         """发送TaskFailed响应"""
-        response = {
-            "header": {
-                "namespace": AliyunTTSNamespace.DEFAULT,
-                "name": AliyunTTSMessageName.TASK_FAILED,
-                "status": AliyunTTSStatus.TASK_FAILED,
-                "message_id": AliyunWSHeader.generate_message_id(),
-                "task_id": task_id,
-                "status_text": reason,
-            }
-        }
+        # 固定字段用预序列化的模板, 只对 task_id / reason 做 JSON 转义
+        text = (
+            f'{{"header":{{{_TASK_FAILED_HEADER_HEAD},'
+            f'"message_id":"{AliyunWSHeader.generate_message_id()}",'
+            f'"task_id":{orjson.dumps(task_id).decode()},'
+            f'"status_text":{orjson.dumps(reason).decode()}}}}}'
+        )
         try:
-            await websocket.send_text(json.dumps(response))
+            await websocket.send_text(text)
             logger.error(f"[{task_id}] 发送TaskFailed: {reason}")
         except:
             pass
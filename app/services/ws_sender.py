@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+WebSocket 下行发送队列
+ASR / TTS 两个 WebSocket 服务共用的连接级 writer 任务
+"""
+
+import asyncio
+from typing import Optional
+
+# 发送队列上限(消息数): 客户端读得慢时处理循环在入队处等待, 保持原有反压
+_OUTBOX_MAXSIZE = 256
+
+
+class QueuedSender:
+    """连接级发送队列: 处理循环只入队, 后台 writer 任务按序写 WebSocket
+
+    处理循环不必等每一帧的网络写入(队列满前可以继续识别 / 合成)。writer 每次
+    醒来把已就绪的消息一次取完再连续写出:
+
+    - merge=True 的二进制帧(裸 PCM)与相邻的同类帧拼接成一帧写出;
+    - 带 replace_key 的文本消息(中间结果)在同一批里只写最后一条, 客户端只展示
+      最新的中间结果, 积压时被覆盖的旧结果不必再写出。
+
+    写失败后记录异常, 下一次 send_* 抛出, 由调用方按原逻辑转成 WebSocketDisconnect。
+    """
+
+    def __init__(self, websocket):
+        self._websocket = websocket
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=_OUTBOX_MAXSIZE)
+        self._error: Optional[BaseException] = None
+        self._task = asyncio.create_task(self._writer_loop())
+
+    async def send_text(self, text: str, replace_key=None) -> None:
+        if self._error is not None:
+            raise self._error
+        await self._queue.put((False, text, False, replace_key))
+
+    async def send_bytes(self, data: bytes, merge: bool = False) -> None:
+        """merge=True 表示该帧可与相邻的同类帧直接拼接(裸 PCM)"""
+        if self._error is not None:
+            raise self._error
+        await self._queue.put((True, data, merge, None))
+
+    async def _writer_loop(self) -> None:
+        queue = self._queue
+        websocket = self._websocket
+        try:
+            while True:
+                batch = [await queue.get()]
+                while True:
+                    try:
+                        batch.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                # 每个 replace_key 只保留批内最后一条, 其余消息顺序不变
+                last_pos = {}
+                for pos, item in enumerate(batch):
+                    if item is not None and item[3] is not None:
+                        last_pos[item[3]] = pos
+                pending = bytearray()
+                for pos, item in enumerate(batch):
+                    if item is None:
+                        if pending:
+                            await websocket.send_bytes(bytes(pending))
+                        return
+                    is_bytes, data, merge, replace_key = item
+                    if replace_key is not None and last_pos[replace_key] != pos:
+                        continue
+                    if merge:
+                        pending += data
+                        continue
+                    if pending:
+                        await websocket.send_bytes(bytes(pending))
+                        pending.clear()
+                    if is_bytes:
+                        await websocket.send_bytes(data)
+                    else:
+                        await websocket.send_text(data)
+                if pending:
+                    await websocket.send_bytes(bytes(pending))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._error = e
+
+    async def aclose(self) -> None:
+        """写完已入队的消息后结束 writer 任务"""
+        if not self._task.done():
+            try:
+                await self._queue.put(None)
+                await self._task
+            except asyncio.CancelledError:
+                self._task.cancel()
+                raise
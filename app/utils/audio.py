@@ -12,6 +12,7 @@ import soundfile as sf
 import numpy as np
 import subprocess
 import logging
+from functools import lru_cache
 from typing import Tuple, Optional, Union
 from io import BytesIO
 from pathlib import Path
@@ -26,6 +27,13 @@ from ..models.common import SampleRate, AudioFormat
 
 logger = logging.getLogger(__name__)
 
+# 支持的格式 / 采样率集合, 按枚举在 import 时建好, 校验时 O(1) 查找
+_SUPPORTED_FORMATS = frozenset(fmt.lower() for fmt in AudioFormat.get_enums())
+_SUPPORTED_SAMPLE_RATES = frozenset(SampleRate.get_enums())
+
+# soundfile(libsndfile) 可直接解码的扩展名, 走 sf.read 快路径, 其余格式仍交给 librosa
+_SOUNDFILE_EXTENSIONS = frozenset({".wav", ".flac", ".ogg"})
+
 
 def validate_audio_format(format_str: Optional[str]) -> bool:
     """验证音频格式是否支持"""
@@ -33,10 +41,7 @@ def validate_audio_format(format_str: Optional[str]) -> bool:
         return True  # 如果未指定格式，允许通过
 
     # 统一转换为小写进行比较
-    format_lower = format_str.lower()
-    supported_formats = [fmt.lower() for fmt in AudioFormat.get_enums()]
-
-    return format_lower in supported_formats
+    return format_str.lower() in _SUPPORTED_FORMATS
 
 
 def validate_sample_rate(sample_rate: Optional[int]) -> bool:
@@ -44,7 +49,7 @@ def validate_sample_rate(sample_rate: Optional[int]) -> bool:
     if not sample_rate:
         return True  # 如果未指定采样率，允许通过
 
-    return sample_rate in SampleRate.get_enums()
+    return sample_rate in _SUPPORTED_SAMPLE_RATES
 
 
 def download_audio_from_url(url: str, max_size: int = None) -> bytes:
@@ -144,13 +149,70 @@ def load_audio_file(audio_path: str, target_sr: int = 16000) -> Tuple[np.ndarray
         AudioProcessingException: 加载失败
     """
     try:
-        # 使用librosa加载音频
+        if Path(audio_path).suffix.lower() in _SOUNDFILE_EXTENSIONS:
+            try:
+                # 直接按 float32 解码, 省去 librosa 的格式分发与 float64 往返
+                audio_data, sr = sf.read(audio_path, dtype="float32", always_2d=False)
+                if audio_data.ndim > 1:
+                    audio_data = audio_data.mean(axis=1, dtype=np.float32)
+                if sr != target_sr:
+                    # 不指定 res_type: 与同版本 librosa.load 的默认重采样器一致
+                    # (锁定的 0.9.2 为 kaiser_best, 依赖 resampy; soxr 未声明)
+                    audio_data = librosa.resample(
+                        audio_data, orig_sr=sr, target_sr=target_sr
+                    )
+                return audio_data, target_sr
+            except Exception as e:
+                logger.debug(f"soundfile 解码失败, 回退 librosa: {e}")
+
+        # 其余格式使用librosa加载音频
         audio_data, sr = librosa.load(audio_path, sr=target_sr)
         return audio_data, sr
     except Exception as e:
         raise DefaultServerErrorException(f"加载音频文件失败: {str(e)}")
 
 
+@lru_cache(maxsize=256)
+def _audio_duration_cached(audio_path: str, mtime_ns: int, size: int) -> float:
+    """按 (路径, mtime, 大小) 缓存的时长探测, 文件被改写后键自然失效"""
+    try:
+        # 只读文件头, 不解码 PCM
+        return sf.info(audio_path).duration
+    except Exception:
+        pass
+
+    # soundfile 不支持的格式(如 m4a/aac), 用 ffprobe 读容器时长
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe",
+                "-v",
+                "error",
+                "-show_entries",
+                "format=duration",
+                "-of",
+                "default=nw=1:nk=1",
+                audio_path,
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        return float(result.stdout.strip())
+    except (
+        subprocess.CalledProcessError,
+        subprocess.TimeoutExpired,
+        FileNotFoundError,
+        ValueError,
+    ):
+        pass
+
+    # 兜底: 解码后计算时长
+    y, sr = librosa.load(audio_path, sr=None)
+    return librosa.get_duration(y=y, sr=sr)
+
+
 def get_audio_duration(audio_path: str) -> float:
     """获取音频文件时长
 
@@ -164,10 +226,8 @@ def get_audio_duration(audio_path: str) -> float:
         AudioProcessingException: 获取时长失败
     """
     try:
-        # Load audio and get duration
-        y, sr = librosa.load(audio_path, sr=None)
-        duration = librosa.get_duration(y=y, sr=sr)
-        return duration
+        stat = os.stat(audio_path)
+        return _audio_duration_cached(audio_path, stat.st_mtime_ns, stat.st_size)
     except Exception as e:
         raise DefaultServerErrorException(f"获取音频时长失败: {str(e)}")
 
@@ -259,19 +319,11 @@ def resample_audio_array(
         return audio_array
 
 
-def adjust_audio_volume(audio_array: np.ndarray, volume: int) -> np.ndarray:
-    """调节音频音量
-
-    Args:
-        audio_array: 音频数据数组
-        volume: 音量值，范围0~100，50为原始音量
+def _volume_gain(audio_array: np.ndarray, volume: int) -> float:
+    """计算音量调节与防削波归一化合并后的总增益
 
-    Returns:
-        调节后的音频数据
+    峰值只扫描一遍, 调用方再做一次乘法即可完成两步处理。
     """
-    if int(volume) == 50:
-        return audio_array
-
     if volume < 0 or volume > 100:
         logger.warning(f"音量值{volume}超出范围[0,100]，使用默认值50")
         volume = 50
@@ -279,17 +331,33 @@ def adjust_audio_volume(audio_array: np.ndarray, volume: int) -> np.ndarray:
     # 将音量值转换为倍数 (0-100 -> 0-2.0)
     volume_factor = volume / 50.0
 
-    # 应用音量调节
-    adjusted_audio = audio_array * volume_factor
+    # max/min 两次归约不分配临时数组, 等价于 np.max(np.abs(x))
+    peak = float(max(audio_array.max(), -audio_array.min())) if audio_array.size else 0.0
 
     # 防止削波，如果音量过大导致超过范围，进行归一化
-    max_val = np.max(np.abs(adjusted_audio))
+    max_val = peak * volume_factor
     if max_val > 1.0:
-        adjusted_audio = adjusted_audio / max_val
         logger.info(f"音量调节后进行归一化，最大值: {max_val:.3f}")
+        return volume_factor / max_val
+    return volume_factor
 
-    logger.info(f"音频音量已调节: {volume}/100 (倍数: {volume_factor:.2f})")
-    return adjusted_audio
+
+def adjust_audio_volume(audio_array: np.ndarray, volume: int) -> np.ndarray:
+    """调节音频音量
+
+    Args:
+        audio_array: 音频数据数组
+        volume: 音量值，范围0~100，50为原始音量
+
+    Returns:
+        调节后的音频数据
+    """
+    if int(volume) == 50:
+        return audio_array
+
+    gain = _volume_gain(audio_array, volume)
+    logger.info(f"音频音量已调节: {volume}/100 (增益: {gain:.2f})")
+    return audio_array * gain
 
 
 def save_audio_array(
@@ -321,17 +389,13 @@ def save_audio_array(
         if original_sr and original_sr != sample_rate:
             audio_array = resample_audio_array(audio_array, original_sr, sample_rate)
 
-        # 调节音频音量
-        audio_array = adjust_audio_volume(audio_array, volume)
-
-        # 确保音频数据是float32格式
-        if audio_array.dtype != np.float32:
+        # 音量调节与 [-1, 1] 归一化合并为一次乘法, 同时完成 float32 转换
+        gain = _volume_gain(audio_array, volume)
+        if gain != 1.0:
+            audio_array = np.multiply(audio_array, gain, dtype=np.float32)
+        elif audio_array.dtype != np.float32:
             audio_array = audio_array.astype(np.float32)
 
-        # 确保音频数据在正确的范围内
-        if np.max(np.abs(audio_array)) > 1.0:
-            audio_array = audio_array / np.max(np.abs(audio_array))
-
         # 确保是2D张量 (channels, samples)
         if audio_array.ndim == 1:
             audio_array = audio_array[np.newaxis, :]  # 添加通道维度
@@ -7,6 +7,8 @@ import numpy as np
 import logging
 from typing import Tuple, Dict
 
+from .audio_kernels import rms_energy
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,7 +23,8 @@ def calculate_rms_energy(audio_array: np.ndarray) -> float:
     """
     if len(audio_array) == 0:
         return 0.0
-    return float(np.sqrt(np.mean(audio_array ** 2)))
+    # 单遍 Numba 内核, 流式热路径上每个 chunk 都会调用
+    return rms_energy(np.ascontiguousarray(audio_array, dtype=np.float32).ravel())
 
 
 def is_nearfield_voice(
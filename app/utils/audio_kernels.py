@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+音频数值内核 - 流式热路径上的逐样本循环, 用 Numba 编译为单遍 SIMD 循环
+
+numba 由 librosa 间接引入, 网关已在 pyproject 中显式声明。内核带显式签名,
+import 时即编译(cache=True 落盘, 之后启动直接加载), 不会把首次 JIT 延迟
+带到某条 WebSocket 连接上。入参需为 C 连续的 float32 / int16 数组。
+"""
+
+import numpy as np
+from numba import njit, types
+
+# np.frombuffer(bytes) 得到的是只读数组, numba 把它当作另一种类型, 需单独声明签名
+_ro_int16_1d = types.Array(types.int16, 1, "C", readonly=True)
+_ro_float32_1d = types.Array(types.float32, 1, "C", readonly=True)
+
+
+@njit(
+    [
+        types.void(_ro_float32_1d, types.int16[::1]),
+        "void(float32[::1], int16[::1])",
+    ],
+    cache=True,
+    nogil=True,
+)
+def float32_to_pcm16(src, dst):
+    """float32 [-1, 1] → int16 PCM, 单遍完成缩放 + 饱和 + 截断
+
+    与 np.frombuffer(int16) / 32768 互逆: 缩放系数取 32768, 超出 int16
+    范围的样本(如 +1.0)饱和到 32767 / -32768, 而不是溢出回绕。
+    """
+    for i in range(src.size):
+        v = src[i] * 32768.0
+        if v > 32767.0:
+            v = 32767.0
+        elif v < -32768.0:
+            v = -32768.0
+        dst[i] = int(v)
+
+
+@njit(
+    [
+        types.void(_ro_float32_1d, types.int16[::1]),
+        "void(float32[::1], int16[::1])",
+    ],
+    cache=True,
+    nogil=True,
+)
+def float32_to_pcm16_clip(src, dst):
+    """float32 → int16 PCM, 先截到 [-1, 1] 再乘 32767 并向零取整
+
+    与 (np.clip(x, -1, 1) * 32767).astype(np.int16) 逐样本一致(float32 乘法),
+    TTS 下行沿用这一缩放, 输出与原实现相同; +1.0 / -1.0 映射为 ±32767。
+    """
+    scale = np.float32(32767.0)
+    one = np.float32(1.0)
+    for i in range(src.size):
+        v = src[i]
+        if v > one:
+            v = one
+        elif v < -one:
+            v = -one
+        dst[i] = int(v * scale)
+
+
+@njit(
+    [
+        types.void(_ro_int16_1d, types.float32[::1]),
+        "void(int16[::1], float32[::1])",
+    ],
+    cache=True,
+    nogil=True,
+    fastmath=True,
+)
+def pcm16_to_float32(src, dst):
+    """int16 PCM → float32 [-1, 1], 单遍乘 1/32768 直接写入 dst(float32 乘法, 可向量化)"""
+    scale = np.float32(1.0 / 32768.0)
+    for i in range(src.size):
+        dst[i] = src[i] * scale
+
+
+@njit(
+    [
+        types.float64(_ro_float32_1d, types.float64),
+        "float64(float32[::1], float64)",
+    ],
+    cache=True,
+    nogil=True,
+)
+def abs_max_until(src, limit):
+    """单遍求 max|x|, 一旦某个样本超过 limit 立即返回该值
+
+    只关心 "max|x| < limit" 的判定时, 有声帧通常在前几个样本就提前结束。
+    """
+    peak = 0.0
+    for i in range(src.size):
+        v = abs(src[i])
+        if v > limit:
+            return v
+        if v > peak:
+            peak = v
+    return peak
+
+
+@njit(
+    [types.float64(_ro_float32_1d), "float64(float32[::1])"],
+    cache=True,
+    nogil=True,
+    fastmath=True,
+)
+def rms_energy(src):
+    """单遍平方累加求 RMS (float64 累加), 不生成 a**2 临时数组"""
+    acc = 0.0
+    for i in range(src.size):
+        v = src[i]
+        acc += v * v
+    return (acc / src.size) ** 0.5 if src.size else 0.0
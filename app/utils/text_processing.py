@@ -5,9 +5,14 @@
 """
 
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# wetext 中文 ITN 的改写(数字/日期/时间/百分数/金额等)都由中文数字字符触发;
+# 不含这些字符的文本, normalize 的结果与 text.strip() 相同, 可跳过整个 FST 处理
+_ITN_TRIGGER = re.compile("[零〇一二三四五六七八九十百千万亿两幺壹贰叁肆伍陆柒捌玖拾佰仟萬億]")
+
 # wetext导入 - 延迟导入以避免初始化问题
 _wetext_normalizer = None
 
@@ -43,10 +48,13 @@ def apply_itn_to_text(text: str) -> str:
     if not text or not text.strip():
         return text
 
+    if _ITN_TRIGGER.search(text) is None:
+        return text.strip()
+
     try:
         normalizer = _get_normalizer()
         result = normalizer.normalize(text)
-        logger.debug(f"ITN处理: '{text}' -> '{result}'")
+        logger.debug("ITN处理: '%s' -> '%s'", text, result)
         return result
     except Exception as e:
         logger.warning(f"ITN处理失败: {text}, 错误: {str(e)}")
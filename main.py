@@ -32,6 +32,8 @@ if __name__ == "__main__":
         "main:app",
         host=settings.HOST,
         port=settings.PORT,
+        # 与 start.py 一致: 音频下行不做 permessage-deflate
+        ws_per_message_deflate=False,
         reload=settings.DEBUG,
         log_level=settings.LOG_LEVEL.lower(),
         access_log=True,
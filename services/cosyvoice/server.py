@@ -24,6 +24,7 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import functools
 import io
 import json
 import logging
@@ -33,6 +34,7 @@ import sys
 import tempfile
 import threading
 import types
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -50,6 +52,7 @@ from fastapi import (
     WebSocketDisconnect,
 )
 from fastapi.responses import JSONResponse, Response
+from fastapi.websockets import WebSocketState
 
 
 logger = logging.getLogger("cosyvoice_service")
@@ -674,11 +677,20 @@ def _get_gpu_semaphore() -> asyncio.Semaphore:
     return _gpu_semaphore
 
 
+# 推理专用线程池: 与 GPU 并发数一致, 整段合成与流式合成都在这几个常驻线程上跑,
+# 不占用 loop 默认线程池(to_thread), 也不为每条流新建线程
+_inference_executor = ThreadPoolExecutor(
+    max_workers=GPU_INFERENCE_CONCURRENCY, thread_name_prefix="cosyvoice-infer"
+)
+
+
 async def _run_inference(func, *args, **kwargs):
-    """整段合成: offload 到线程 + GPU 并发限制"""
+    """整段合成: offload 到推理线程池 + GPU 并发限制"""
     sem = _get_gpu_semaphore()
     async with sem:
-        return await asyncio.to_thread(func, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(
+            _inference_executor, functools.partial(func, *args, **kwargs)
+        )
 
 
 @asynccontextmanager
@@ -961,34 +973,62 @@ async def tts_stream(websocket: WebSocket) -> None:
             )
         return engine.inference_sft(text, voice, stream=True, speed=speed)
 
-    def _next_chunk(it):
-        """逐帧 next() — 在工作线程里跑, 每帧 = 一次 GPU 推理"""
+    # 整段流式合成只占推理线程池里的一个线程: 线程里创建并迭代同步生成器, 每帧经
+    # call_soon_threadsafe 交回 event loop。相比逐帧 to_thread 省掉每帧一次线程池
+    # 派发, 且推理下一帧与发送当前帧可以重叠; 持有 GPU 信号量期间线程池必有空闲线程
+    loop = asyncio.get_running_loop()
+    chunks: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+
+    def _emit(item) -> None:
         try:
-            return next(it)
-        except StopIteration:
-            return _SENTINEL
+            loop.call_soon_threadsafe(chunks.put_nowait, item)
+        except RuntimeError:
+            pass  # event loop 已关闭(进程退出中)
+
+    def _produce() -> None:
+        try:
+            # CosyVoice 的 inference_* 在第一帧之前可能做不少同步 CPU 工作
+            # (文本归一化 / token 化), 也一并留在这个线程里
+            gen = _make_gen()
+            try:
+                for audio_data in gen:
+                    # 张量 → float32 字节也在推理线程里做完, event loop 只管发送。
+                    # 不在这里量化成 int16: CosyVoice 的 tts() 产出前已 .cpu(), 没有
+                    # D2H 可省; 网关侧还要按 float32 做重采样 / 音量, 量化放在网关最后一步
+                    chunk = audio_data["tts_speech"].numpy()
+                    if chunk.ndim == 2:
+                        chunk = chunk[0]
+                    _emit(np.asarray(chunk, dtype=np.float32).tobytes())
+                    # 客户端断开 → 不再推理下一帧, 不再消耗 GPU
+                    if stop.is_set():
+                        break
+            finally:
+                gen.close()
+            _emit(_SENTINEL)
+        except Exception as exc:
+            _emit(exc)
 
     try:
         async with sem:
-            # 在线程里创建生成器 (CosyVoice 的 inference_* 在第一帧之前可能做不少
-            # 同步 CPU 工作: 文本归一化 / token 化), 这里也 offload 出 event loop
-            gen = await asyncio.to_thread(_make_gen)
-
-            while True:
-                # 客户端断开 → 跳出, 不再消耗 GPU
-                if websocket.client_state.name != "CONNECTED":
-                    logger.info("TTS WS 客户端已断开, 停止合成")
-                    break
-
-                audio_data = await asyncio.to_thread(_next_chunk, gen)
-                if audio_data is _SENTINEL:
-                    break
-
-                chunk = audio_data["tts_speech"].numpy()
-                if chunk.ndim == 2:
-                    chunk = chunk[0]
-                chunk_f32 = np.asarray(chunk, dtype=np.float32)
-                await websocket.send_bytes(chunk_f32.tobytes())
+            producer = loop.run_in_executor(_inference_executor, _produce)
+            try:
+                while True:
+                    chunk_bytes = await chunks.get()
+                    if chunk_bytes is _SENTINEL:
+                        break
+                    if isinstance(chunk_bytes, Exception):
+                        raise chunk_bytes
+
+                    if websocket.client_state is not WebSocketState.CONNECTED:
+                        logger.info("TTS WS 客户端已断开, 停止合成")
+                        break
+
+                    await websocket.send_bytes(chunk_bytes)
+            finally:
+                stop.set()
+                # 等当前这帧推理结束再释放 GPU 信号量, 避免与下一条请求抢卡
+                await producer
 
         await websocket.send_json({"type": "done"})
 
@@ -60,3 +60,42 @@ def test_text_normalize_no_engine(client):
     )
     assert r.status_code == 200
     assert r.json()["sentences"] == ["hello world"]
+
+
+def test_tts_stream_runs_generator_on_one_thread(client, monkeypatch):
+    import threading
+
+    import numpy as np
+    import server  # type: ignore[import-not-found]
+
+    class _Speech:
+        def __init__(self, n):
+            self._audio = np.full((1, n), 0.1, dtype=np.float32)
+
+        def numpy(self):
+            return self._audio
+
+    class _FakeSft:
+        sample_rate = 22050
+
+        def __init__(self):
+            self.threads = set()
+
+        def inference_sft(self, text, voice, stream=True, speed=1.0):
+            for n in (100, 200, 300):
+                self.threads.add(threading.get_ident())
+                yield {"tts_speech": _Speech(n)}
+
+    engine = _FakeSft()
+    monkeypatch.setattr(server, "_cosyvoice_sft", engine)
+
+    with client.websocket_connect("/tts/stream?token=test-token") as ws:
+        ws.send_text('{"text": "你好", "voice": "中文女"}')
+        assert ws.receive_json() == {"type": "started", "sample_rate": 22050}
+        sizes = [len(ws.receive_bytes()) for _ in range(3)]
+        assert ws.receive_json() == {"type": "done"}
+
+    assert sizes == [400, 800, 1200]
+    # 整段流式合成的每一帧都在推理线程池的同一个线程里推理
+    assert len(engine.threads) == 1
+    assert threading.get_ident() not in engine.threads
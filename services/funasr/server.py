@@ -14,6 +14,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import io
 import json
 import logging
@@ -22,6 +23,7 @@ import tempfile
 import threading
 
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import Optional
 
@@ -58,7 +60,7 @@ INTERNAL_SERVICE_TOKEN = os.getenv("INTERNAL_SERVICE_TOKEN", "")
 
 # GPU 上同一时刻允许并发推理的最大数量 — funasr 是 torch 模型, 同卡上多线程并发
 # 通常无加速, 反而增加上下文切换。固定 = 1 (串行化进 GPU)。
-# event loop 由 to_thread 保证不阻塞, 多客户端的 HTTP/WS 解析仍可并行。
+# event loop 由推理专用线程池保证不阻塞, 多客户端的 HTTP/WS 解析仍可并行。
 # 横向扩展请用多副本 (docker compose up --scale funasr-0=N), 不要调这个。
 GPU_INFERENCE_CONCURRENCY = 1
 
@@ -331,13 +333,22 @@ def _get_gpu_semaphore() -> asyncio.Semaphore:
     return _gpu_semaphore
 
 
+# 推理专用线程池: 与 GPU 并发数一致, 不占用 loop 默认线程池(to_thread),
+# 模型调用也总落在固定线程上
+_inference_executor = ThreadPoolExecutor(
+    max_workers=GPU_INFERENCE_CONCURRENCY, thread_name_prefix="funasr-infer"
+)
+
+
 async def _run_inference(func, *args, **kwargs):
-    """把同步推理 offload 到默认线程池, 并用 semaphore 限制 GPU 并发。
+    """把同步推理 offload 到推理专用线程池, 并用 semaphore 限制 GPU 并发。
     解决: 同步 torch 推理被直接放在 async handler 里 → 阻塞 event loop, 单 in-flight。
     """
     sem = _get_gpu_semaphore()
     async with sem:
-        return await asyncio.to_thread(func, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(
+            _inference_executor, functools.partial(func, *args, **kwargs)
+        )
 
 
 @asynccontextmanager
@@ -535,6 +546,9 @@ async def asr_stream(websocket: WebSocket) -> None:
     enable_realtime_punc = False
     audio_cache: dict = {}
     punc_cache: dict = {}
+    # 上一次实时 PUNC 的输入/输出; 相邻 partial 文本相同时直接复用, 省一次推理
+    last_punc_in = None
+    last_punc_out = ""
 
     try:
         while True:
@@ -597,6 +611,7 @@ async def asr_stream(websocket: WebSocket) -> None:
                     # flush 后清空 cache, 下一个 sentence 重新开始
                     audio_cache.clear()
                     punc_cache.clear()
+                    last_punc_in = None
 
                 elif op == "close":
                     break
@@ -665,14 +680,21 @@ async def asr_stream(websocket: WebSocket) -> None:
                     )
                     continue
 
+                # 实时 PUNC 紧接 ASR 串行执行: 两者都经 _run_inference 受同一 GPU
+                # semaphore(并发 1)约束, 拆成后台任务与下一 chunk 的 ASR 也无法重叠;
+                # 且网关每个 chunk 同步等待 partial, 晚到的 text_punc 无处回填。
                 text_punc = ""
                 if enable_realtime_punc and text_raw:
-                    try:
-                        text_punc = await _run_inference(
-                            punc_realtime_apply, text_raw, punc_cache
-                        )
-                    except Exception as exc:
-                        logger.warning("实时 PUNC 失败: %s", exc)
+                    if text_raw == last_punc_in:
+                        text_punc = last_punc_out
+                    else:
+                        try:
+                            text_punc = await _run_inference(
+                                punc_realtime_apply, text_raw, punc_cache
+                            )
+                            last_punc_in, last_punc_out = text_raw, text_punc
+                        except Exception as exc:
+                            logger.warning("实时 PUNC 失败: %s", exc)
 
                 await websocket.send_json(
                     {
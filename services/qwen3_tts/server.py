@@ -44,6 +44,7 @@ from fastapi import (
     WebSocketDisconnect,
 )
 from fastapi.responses import JSONResponse, Response
+from fastapi.websockets import WebSocketState
 
 
 logger = logging.getLogger("qwen3_tts_service")
@@ -772,7 +773,7 @@ async def tts_stream(websocket: WebSocket) -> None:
 
         chunk_size = max(1, int(native_sr * STREAM_CHUNK_SEC))
         for start in range(0, len(audio), chunk_size):
-            if websocket.client_state.name != "CONNECTED":
+            if websocket.client_state is not WebSocketState.CONNECTED:
                 break
             chunk = np.asarray(audio[start:start + chunk_size], dtype=np.float32)
             await websocket.send_bytes(chunk.tobytes())
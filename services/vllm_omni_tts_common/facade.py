@@ -45,6 +45,7 @@ from fastapi import (
     WebSocketDisconnect,
 )
 from fastapi.responses import JSONResponse, Response
+from fastapi.websockets import WebSocketState
 
 
 logger = logging.getLogger("vllm_omni_tts_facade")
@@ -432,7 +433,7 @@ class OmniTTSFacade:
 
                 await websocket.send_json({"type": "started", "sample_rate": self.config.sample_rate})
                 async for chunk in self.stream_pcm_float32(text, voice, speed, prompt, language):
-                    if websocket.client_state.name != "CONNECTED":
+                    if websocket.client_state is not WebSocketState.CONNECTED:
                         break
                     await websocket.send_bytes(chunk.tobytes())
                 await websocket.send_json({"type": "done"})
@@ -18,6 +18,15 @@ if __name__ == "__main__":
     # 读取并发配置
     workers = int(os.getenv("WORKERS", "1"))
     thread_pool_size = os.getenv("INFERENCE_THREAD_POOL_SIZE", "auto")
+    realtime_pool_size = os.getenv("REALTIME_THREAD_POOL_SIZE", "auto")
+
+    # uvicorn loop="auto" 在装了 uvloop 时(uvicorn[standard] 自带)使用 uvloop
+    try:
+        import uvloop  # noqa: F401
+
+        event_loop = "uvloop"
+    except ImportError:
+        event_loop = "asyncio"
 
     print("=" * 60)
     print("🚀 FunSpeech API Server")
@@ -31,6 +40,8 @@ if __name__ == "__main__":
     print(f"🧠 TTS模型模式: {settings.TTS_MODEL_MODE}")
     print(f"⚡ Worker进程数: {workers}")
     print(f"⚡ 推理线程池: {thread_pool_size}")
+    print(f"⚡ 实时识别线程池: {realtime_pool_size}")
+    print(f"⚡ 事件循环: {event_loop}")
     print(
         f"📖 API文档: http://{settings.HOST}:{settings.PORT}/docs"
         if settings.DEBUG
@@ -74,6 +85,9 @@ if __name__ == "__main__":
             host=settings.HOST,
             port=settings.PORT,
             workers=workers,
+            loop="auto",
+            # WebSocket 下行主要是 PCM/WAV 音频, 压缩收益可忽略却要两端各跑一遍 deflate
+            ws_per_message_deflate=False,
             reload=settings.DEBUG if workers == 1 else False,  # 多worker时禁用reload
             log_level="debug" if settings.DEBUG else settings.LOG_LEVEL.lower(),
             access_log=True,
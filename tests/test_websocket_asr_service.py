@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import io
+import json
+
+import numpy as np
+import soundfile as sf
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+from app.services import websocket_asr, ws_sender
+
+
+class _FakeSession:
+    def close(self):
+        pass
+
+
+class _FakeRealtimeModel:
+    """按 HTTP 引擎的伪 realtime_model 约定返回: 有声 chunk 出一个数字, 静音出空串"""
+
+    def __init__(self):
+        self.calls = []
+        self.count = 0
+
+    def generate(self, *, input, cache, is_final, chunk_size=None, **kwargs):
+        self.calls.append((len(input), is_final, kwargs.get("format")))
+        if is_final:
+            # 与真实引擎一致: is_final 只 flush, 不处理 input
+            cache.pop("session", None)
+            return []
+        cache.setdefault("session", _FakeSession())
+        if float(np.max(np.abs(input))) > 0.05:
+            self.count += 1
+            return [{"text": str(self.count), "_text_punc": f"{self.count}，"}]
+        return [{"text": ""}]
+
+
+class _FakeASREngine:
+    def __init__(self):
+        self.realtime_model = _FakeRealtimeModel()
+
+
+def _header(name):
+    return {
+        "namespace": "SpeechTranscriber",
+        "name": name,
+        "task_id": "task-1",
+        "message_id": "m",
+    }
+
+
+def _tone(samples):
+    t = np.arange(samples)
+    return (np.sin(t / 5.0) * 0.3 * 32767).astype(np.int16).tobytes()
+
+
+def _silence(samples):
+    return np.zeros(samples, dtype=np.int16).tobytes()
+
+
+def _run_session(monkeypatch, frames, payload=None):
+    monkeypatch.setattr(settings, "APPTOKEN", None)
+    service = websocket_asr.AliyunWebSocketASRService()
+    service.asr_engine = _FakeASREngine()
+    monkeypatch.setattr(websocket_asr, "_aliyun_websocket_asr_service", service)
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v1/asr") as ws:
+        ws.send_text(
+            json.dumps(
+                {
+                    "header": _header("StartTranscription"),
+                    "payload": {"format": "pcm", "sample_rate": 16000, **(payload or {})},
+                }
+            )
+        )
+        started = json.loads(ws.receive_text())
+        assert started["header"]["name"] == "TranscriptionStarted"
+
+        for frame in frames:
+            ws.send_bytes(frame)
+        ws.send_text(json.dumps({"header": _header("StopTranscription")}))
+
+        messages = []
+        while True:
+            message = json.loads(ws.receive_text())
+            messages.append(message)
+            if message["header"]["name"] in ("TranscriptionCompleted", "TaskFailed"):
+                break
+    return messages, service.asr_engine.realtime_model.calls
+
+
+def test_websocket_asr_sentence_lifecycle(monkeypatch):
+    frames = [_tone(1600)] * 12 + [_silence(1600)] * 24
+    messages, calls = _run_session(monkeypatch, frames)
+
+    names = [m["header"]["name"] for m in messages]
+    assert names[0] == "SentenceBegin"
+    assert "TranscriptionResultChanged" in names
+    assert names[-2:] == ["SentenceEnd", "TranscriptionCompleted"]
+    assert messages[-2]["payload"]["result"] == "12345"
+    # 100ms 小帧在网关侧合并成标准 chunk(240ms, 排队积压时 600ms)后才送模型
+    assert all(n in (3840, 9600) for n, is_final, _ in calls if not is_final)
+    assert len({m["header"]["message_id"] for m in messages}) == len(messages)
+
+
+def test_websocket_asr_flushes_sub_chunk_tail_on_stop(monkeypatch):
+    # 300ms 尾音不足最小 chunk, StopTranscription 时先作为普通 chunk 送出再 flush
+    monkeypatch.setattr(settings, "ASR_REALTIME_MIN_CHUNK_MS", 600)
+    messages, calls = _run_session(monkeypatch, [_tone(1600)] * 3)
+
+    names = [m["header"]["name"] for m in messages]
+    assert names == ["SentenceBegin", "SentenceEnd", "TranscriptionCompleted"]
+    assert messages[1]["payload"]["result"] == "1"
+    assert calls == [(4800, False, "pcm"), (0, True, "pcm")]
+
+
+def test_websocket_asr_wav_stream_header_only_on_first_frame(monkeypatch):
+    first = io.BytesIO()
+    sf.write(
+        first,
+        np.frombuffer(_tone(1600), dtype=np.int16),
+        16000,
+        format="WAV",
+        subtype="PCM_16",
+    )
+    frames = [first.getvalue()] + [_tone(1600)] * 11 + [_silence(1600)] * 24
+    messages, calls = _run_session(monkeypatch, frames, {"format": "wav"})
+
+    names = [m["header"]["name"] for m in messages]
+    assert "TaskFailed" not in names
+    assert names[-2:] == ["SentenceEnd", "TranscriptionCompleted"]
+    # WAV 头在网关剥离, 送子服务的始终是 PCM16
+    assert {fmt for _, _, fmt in calls} == {"pcm"}
+
+
+def test_queued_sender_keeps_only_latest_partial_per_sentence():
+    class _Recorder:
+        def __init__(self):
+            self.sent = []
+
+        async def send_text(self, text):
+            self.sent.append(text)
+
+    async def scenario():
+        ws = _Recorder()
+        sender = ws_sender.QueuedSender(ws)
+        # writer 尚未运行, 以下消息在同一批内被取出
+        await sender.send_text("begin-1")
+        await sender.send_text("partial-1a", replace_key=1)
+        await sender.send_text("partial-1b", replace_key=1)
+        await sender.send_text("end-1")
+        await sender.aclose()
+        return ws.sent
+
+    assert asyncio.run(scenario()) == ["begin-1", "partial-1b", "end-1"]
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+from app.services import websocket_tts, ws_sender
+
+
+class _FakeStreamingTTSEngine:
+    """按 iter_stream_audio_chunks 约定逐块产出 (float32 数组, 原生采样率)"""
+
+    def __init__(self, chunk_samples=320, chunks=20, sample_rate=16000, readonly=False):
+        self.chunk_samples = chunk_samples
+        self.chunks = chunks
+        self.sample_rate = sample_rate
+        # 真实 HTTP 引擎用 np.frombuffer(msg) 解包, 得到的是只读数组
+        self.readonly = readonly
+
+    async def iter_stream_audio_chunks(self, *, text, voice, speed, prompt=""):
+        for i in range(self.chunks):
+            chunk = np.full(self.chunk_samples, 0.1 * (i % 5), dtype=np.float32)
+            if self.readonly:
+                chunk = np.frombuffer(chunk.tobytes(), dtype=np.float32)
+            yield chunk, self.sample_rate
+
+
+class _StallingTTSEngine:
+    """首块后再出一个 20ms 小块, 随后模型卡住一段时间才出最后一块"""
+
+    def __init__(self, stall_s=0.3, sample_rate=16000):
+        self.stall_s = stall_s
+        self.sample_rate = sample_rate
+
+    async def iter_stream_audio_chunks(self, *, text, voice, speed, prompt=""):
+        chunk = np.full(320, 0.1, dtype=np.float32)
+        yield chunk, self.sample_rate
+        await asyncio.sleep(0.005)
+        yield chunk, self.sample_rate
+        await asyncio.sleep(self.stall_s)
+        yield chunk, self.sample_rate
+
+
+def _header(name):
+    return {
+        "namespace": "FlowingSpeechSynthesizer",
+        "name": name,
+        "task_id": "task-1",
+        "message_id": "m",
+    }
+
+
+def _run_session(monkeypatch, engine, payload=None):
+    monkeypatch.setattr(settings, "APPTOKEN", None)
+    service = websocket_tts.AliyunWebSocketTTSService()
+    service.tts_engine = engine
+    monkeypatch.setattr(websocket_tts, "_aliyun_websocket_tts_service", service)
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v1/tts") as ws:
+        ws.send_text(
+            json.dumps(
+                {
+                    "header": _header("StartSynthesis"),
+                    "payload": {"format": "PCM", "sample_rate": 16000, **(payload or {})},
+                }
+            )
+        )
+        started = json.loads(ws.receive_text())
+        assert started["header"]["name"] == "SynthesisStarted"
+
+        ws.send_text(
+            json.dumps({"header": _header("RunSynthesis"), "payload": {"text": "你好"}})
+        )
+        ws.send_text(json.dumps({"header": _header("StopSynthesis")}))
+
+        frames, messages = [], []
+        while True:
+            message = ws.receive()
+            if message.get("bytes") is not None:
+                frames.append(message["bytes"])
+                continue
+            data = json.loads(message["text"])
+            messages.append(data)
+            if data["header"]["name"] in ("SynthesisCompleted", "TaskFailed"):
+                break
+    return frames, messages
+
+
+def test_websocket_tts_coalesces_small_pcm_chunks(monkeypatch):
+    engine = _FakeStreamingTTSEngine(chunk_samples=320, chunks=20)
+    frames, messages = _run_session(monkeypatch, engine)
+
+    names = [m["header"]["name"] for m in messages]
+    assert names[0] == "SentenceBegin"
+    assert names[-2:] == ["SentenceEnd", "SynthesisCompleted"]
+    assert names.count("SentenceSynthesis") == 1
+    assert messages[-2]["payload"]["subtitles"][0]["text"] == "你好"
+    # 首批立即下发, 之后的 20ms 小块攒够 100ms 再发(已就绪的块会被一次取出合并), 采样总数不变
+    assert all(len(f) >= 1600 * 2 for f in frames[1:-1])
+    assert sum(len(f) for f in frames) == 320 * 20 * 2
+    assert len(frames) < 20
+
+
+def test_websocket_tts_flushes_pending_pcm_when_model_stalls(monkeypatch):
+    frames, messages = _run_session(monkeypatch, _StallingTTSEngine())
+
+    assert messages[-1]["header"]["name"] == "SynthesisCompleted"
+    # 卡顿前的小块到期即下发, 不会等到下一块到达再与其合并
+    assert [len(f) for f in frames] == [640, 640, 640]
+
+
+def test_websocket_tts_accepts_readonly_chunks_at_native_rate(monkeypatch):
+    # 请求采样率等于引擎原生采样率时不重采样, 只读块直接进入 PCM 转换
+    engine = _FakeStreamingTTSEngine(
+        chunk_samples=480, chunks=10, sample_rate=24000, readonly=True
+    )
+    frames, messages = _run_session(monkeypatch, engine, {"sample_rate": 24000})
+
+    assert messages[-1]["header"]["name"] == "SynthesisCompleted"
+    assert sum(len(f) for f in frames) == 480 * 10 * 2
+
+
+def test_websocket_tts_wav_stream_has_single_header(monkeypatch):
+    engine = _FakeStreamingTTSEngine(chunk_samples=320, chunks=20)
+    frames, messages = _run_session(monkeypatch, engine, {"format": "WAV"})
+
+    assert messages[-1]["header"]["name"] == "SynthesisCompleted"
+    stream = b"".join(frames)
+    # 只有流首带一次 44 字节 RIFF 头, 之后全是 PCM16
+    assert stream.startswith(b"RIFF") and stream.count(b"RIFF") == 1
+    assert len(stream) == 44 + 320 * 20 * 2
+
+
+def test_websocket_tts_task_failed_envelope(monkeypatch):
+    monkeypatch.setattr(settings, "APPTOKEN", None)
+    monkeypatch.setattr(
+        websocket_tts, "_aliyun_websocket_tts_service", websocket_tts.AliyunWebSocketTTSService()
+    )
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v1/tts") as ws:
+        ws.send_text(json.dumps({"header": {**_header("StartSynthesis"), "namespace": "错误"}}))
+        failed = json.loads(ws.receive_text())
+
+    header = failed["header"]
+    assert header["name"] == "TaskFailed"
+    assert header["namespace"] == "Default"
+    assert header["status_text"] == "Invalid namespace"
+    assert len(header["message_id"]) == 32
+
+
+def test_queued_sender_merges_adjacent_pcm_frames():
+    class _Recorder:
+        def __init__(self):
+            self.sent = []
+
+        async def send_bytes(self, data):
+            self.sent.append(data)
+
+        async def send_text(self, text):
+            self.sent.append(text)
+
+    async def scenario():
+        ws = _Recorder()
+        sender = ws_sender.QueuedSender(ws)
+        # writer 尚未运行, 以下消息在同一批内被取出
+        await sender.send_bytes(b"ab", merge=True)
+        await sender.send_bytes(b"cd", merge=True)
+        await sender.send_text("progress")
+        await sender.send_bytes(b"RIFF1")
+        await sender.send_bytes(b"RIFF2")
+        await sender.send_bytes(b"ef", merge=True)
+        await sender.aclose()
+        return ws.sent
+
+    assert asyncio.run(scenario()) == [b"abcd", "progress", b"RIFF1", b"RIFF2", b"ef"]
+
+
+def test_convert_audio_to_pcm_matches_clip_and_32767_scaling():
+    audio = np.array([1.5, 1.0, 0.5, 0.0, -0.25, -1.0, -2.0], dtype=np.float32)
+    readonly = np.frombuffer(audio.tobytes(), dtype=np.float32)
+    service = websocket_tts.AliyunWebSocketTTSService()
+
+    pcm = np.frombuffer(bytes(service._convert_audio_to_pcm(readonly, 16000)), dtype=np.int16)
+    # 与原实现 (np.clip(x, -1, 1) * 32767).astype(int16) 一致, 满幅不触及 -32768
+    expected = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+    assert pcm.tolist() == expected.tolist()
+    assert pcm.tolist() == [32767, 32767, 16383, 0, -8191, -32767, -32767]